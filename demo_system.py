@@ -6,11 +6,11 @@ Demonstrates autonomous honeypot learning vs static deployment
 
 import sys
 import os
-sys.path.append(os.getcwd())
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
 
 from src.environment import CloudHoneynetEnv
 from src.agent import DQNAgent
-from src.monitoring import monitor
 import numpy as np
 import time
 
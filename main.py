@@ -1,5 +1,6 @@
 import time
 import csv
+import logging
 import os
 from datetime import datetime
 from src.agent import DQNAgent
@@ -70,7 +71,7 @@ def run_experiment():
 
     env = CloudHoneynetEnv(host=EC2_HOST, user=EC2_USER, key_file=EC2_KEY_FILE,
                            use_ssm=USE_SSM, ssm_instance_id=ssm_instance, aws_region=AWS_REGION,
-                           dry_run=DRY_RUN)
+                           dry_run=DRY_RUN, verbose=True)
     agent = DQNAgent(state_size=STATE_SIZE, action_size=ACTION_SIZE)
     
     print("Starting attacker thread...")
@@ -115,4 +116,5 @@ def run_experiment():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     run_experiment()
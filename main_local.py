@@ -18,11 +18,18 @@ import argparse
 from datetime import datetime
 import subprocess
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add src to path (once, even if this module is imported again)
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from agent import DQNAgent
 
+# Log lines that count as an attack on each honeypot (matched case-sensitively, as findstr did)
+COWRIE_ATTACK_MARKERS = ('login attempt', 'SSH', 'authentication')
+NGINX_ATTACK_MARKERS = ('GET', 'POST', '404', '401')
+COMPOSE_FILE = 'docker-compose.local.yml'
+
 
 class LocalDockerEnvironment:
     """
@@ -42,11 +49,10 @@ class LocalDockerEnvironment:
         print(f"[Environment] State size: {self.state_size}, Action size: {self.action_size}")
 
     def _execute_docker_command(self, cmd):
-        """Execute docker command locally."""
+        """Execute docker command locally (cmd is an argv list, run without a shell)."""
         try:
             result = subprocess.run(
                 cmd,
-                shell=True,
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -59,10 +65,17 @@ class LocalDockerEnvironment:
 
     def _check_container_running(self, container_name):
         """Check if Docker container is running."""
-        cmd = f'docker ps --filter "name={container_name}" --format "{{{{.Names}}}}"'
+        cmd = ['docker', 'ps', '--filter', f'name={container_name}', '--format', '{{.Names}}']
         stdout, stderr = self._execute_docker_command(cmd)
         return container_name in stdout
 
+    def _logs_contain(self, container_name, markers):
+        """Check whether the container's last 50 log lines mention any of the markers."""
+        # docker logs writes the container's stderr to stderr, so check both streams
+        stdout, stderr = self._execute_docker_command(['docker', 'logs', '--tail', '50', container_name])
+        output = stdout + stderr
+        return any(marker in output for marker in markers)
+
     def _get_state(self):
         """
         Get current state by checking Docker logs.
@@ -75,17 +88,13 @@ class LocalDockerEnvironment:
 
         # Check Cowrie SSH logs for recent attacks
         if self._check_container_running("cowrie_honeypot_local"):
-            cmd = 'docker logs --tail 50 cowrie_honeypot_local 2>&1 | findstr /C:"login attempt" /C:"SSH" /C:"authentication"'
-            stdout, _ = self._execute_docker_command(cmd)
-            if stdout and len(stdout.strip()) > 0:
+            if self._logs_contain("cowrie_honeypot_local", COWRIE_ATTACK_MARKERS):
                 ssh_attack = 1
                 print(f"[Detection] SSH attack detected in Cowrie logs")
 
         # Check nginx web logs for recent requests
         if self._check_container_running("nginx_honeypot_local"):
-            cmd = 'docker logs --tail 50 nginx_honeypot_local 2>&1 | findstr /C:"GET" /C:"POST" /C:"404" /C:"401"'
-            stdout, _ = self._execute_docker_command(cmd)
-            if stdout and len(stdout.strip()) > 0:
+            if self._logs_contain("nginx_honeypot_local", NGINX_ATTACK_MARKERS):
                 web_attack = 1
                 print(f"[Detection] Web attack detected in nginx logs")
 
@@ -97,7 +106,7 @@ class LocalDockerEnvironment:
         print("[Environment] Resetting environment (stopping honeypots)...")
 
         # Stop containers if running
-        self._execute_docker_command("docker stop cowrie_honeypot_local nginx_honeypot_local 2>nul")
+        self._execute_docker_command(['docker', 'stop', 'cowrie_honeypot_local', 'nginx_honeypot_local'])
         self.current_honeypot = 0
 
         time.sleep(2)
@@ -119,17 +128,17 @@ class LocalDockerEnvironment:
             # Stop all honeypots
             if self.current_honeypot != 0:
                 print("[Action] Stopping all honeypots...")
-                self._execute_docker_command("docker stop cowrie_honeypot_local nginx_honeypot_local 2>nul")
+                self._execute_docker_command(['docker', 'stop', 'cowrie_honeypot_local', 'nginx_honeypot_local'])
                 self.current_honeypot = 0
 
         elif action == 1:
             # Deploy Cowrie SSH honeypot
             if self.current_honeypot != 1:
                 print("[Action] Deploying Cowrie SSH honeypot...")
-                self._execute_docker_command("docker stop nginx_honeypot_local 2>nul")
+                self._execute_docker_command(['docker', 'stop', 'nginx_honeypot_local'])
 
                 # Start Cowrie
-                cmd = 'docker-compose -f docker-compose.local.yml up -d cowrie'
+                cmd = ['docker-compose', '-f', COMPOSE_FILE, 'up', '-d', 'cowrie']
                 stdout, stderr = self._execute_docker_command(cmd)
 
                 if "error" not in stderr.lower():
@@ -142,10 +151,10 @@ class LocalDockerEnvironment:
             # Deploy nginx web honeypot
             if self.current_honeypot != 2:
                 print("[Action] Deploying nginx web honeypot...")
-                self._execute_docker_command("docker stop cowrie_honeypot_local 2>nul")
+                self._execute_docker_command(['docker', 'stop', 'cowrie_honeypot_local'])
 
                 # Start nginx
-                cmd = 'docker-compose -f docker-compose.local.yml up -d nginx'
+                cmd = ['docker-compose', '-f', COMPOSE_FILE, 'up', '-d', 'nginx']
                 stdout, stderr = self._execute_docker_command(cmd)
 
                 if "error" not in stderr.lower():
@@ -217,8 +226,11 @@ def main():
     print("=" * 60)
 
     # Check if Docker is available
-    result = subprocess.run("docker --version", shell=True, capture_output=True)
-    if result.returncode != 0:
+    try:
+        result = subprocess.run(['docker', '--version'], capture_output=True)
+    except OSError:
+        result = None  # without a shell, a missing binary raises instead of returning 127
+    if result is None or result.returncode != 0:
         print("\n❌ ERROR: Docker not found!")
         print("Please install Docker Desktop and start it before running this script.")
         print("See LOCAL_TESTING.md for instructions.")
@@ -227,13 +239,12 @@ def main():
     print(f"✓ Docker found: {result.stdout.decode().strip()}")
 
     # Check if honeypot containers exist
-    result = subprocess.run(
-        'docker-compose -f docker-compose.local.yml ps',
-        shell=True,
-        capture_output=True
-    )
+    try:
+        result = subprocess.run(['docker-compose', '-f', COMPOSE_FILE, 'ps'], capture_output=True)
+    except OSError:
+        result = None
 
-    if result.returncode != 0:
+    if result is None or result.returncode != 0:
         print("\n⚠️  Warning: Docker Compose configuration not found or not started")
         print("\nQuick start:")
         print("  1. bash scripts/setup_local_test.sh")
@@ -17,6 +17,27 @@ import requests
 import paramiko
 from datetime import datetime
 
+# Attack payloads and intensity levels are constants, so build them once instead of on every wave
+SQLI_PAYLOADS = (
+    "1' OR '1'='1",
+    "admin'--",
+    "1; DROP TABLE users--",
+    "' UNION SELECT NULL--",
+    "1' AND 1=1--",
+)
+
+STUFFED_CREDENTIALS = (
+    ('admin', 'admin123'),
+    ('user', 'password'),
+    ('root', 'toor'),
+)
+
+INTENSITY_MAP = {
+    'low': {'ssh': 2, 'web': 5, 'sqli': 2, 'cred': 1},
+    'medium': {'ssh': 5, 'web': 10, 'sqli': 5, 'cred': 3},
+    'high': {'ssh': 10, 'web': 20, 'sqli': 10, 'cred': 5},
+}
+
 
 class AttackSimulator:
     """Simulates various attack patterns against honeypots."""
@@ -28,10 +49,10 @@ class AttackSimulator:
         self.web_port = web_port
 
         # Attack patterns
-        self.ssh_usernames = ['root', 'admin', 'ubuntu', 'user', 'test', 'guest']
-        self.ssh_passwords = ['password', '123456', 'admin', 'root', 'toor', '12345']
+        self.ssh_usernames = ('root', 'admin', 'ubuntu', 'user', 'test', 'guest')
+        self.ssh_passwords = ('password', '123456', 'admin', 'root', 'toor', '12345')
 
-        self.web_paths = [
+        self.web_paths = (
             '/',
             '/admin',
             '/login',
@@ -44,15 +65,18 @@ class AttackSimulator:
             '/api/users',
             '/api/v1/auth',
             '/robots.txt',
-        ]
+        )
 
-        self.user_agents = [
+        self.user_agents = (
             'Mozilla/5.0 (compatible; Botnet/1.0)',
             'sqlmap/1.0',
             'Nmap Scripting Engine',
             'nikto/2.1.6',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
-        ]
+        )
+
+        # One keep-alive session for all web attacks instead of a new connection per request
+        self._session = requests.Session()
 
     def ssh_brute_force(self, attempts=5):
         """Simulate SSH brute force attack."""
@@ -101,7 +125,7 @@ class AttackSimulator:
         for i, path in enumerate(paths, 1):
             ua = random.choice(self.user_agents)
             try:
-                response = requests.get(
+                response = self._session.get(
                     f"http://{self.web_host}:{self.web_port}{path}",
                     headers={'User-Agent': ua},
                     timeout=5
@@ -116,17 +140,9 @@ class AttackSimulator:
         """Simulate SQL injection attempts."""
         print(f"\n[SQL Attack] Starting SQLi attempts ({attempts} payloads)...")
 
-        payloads = [
-            "1' OR '1'='1",
-            "admin'--",
-            "1; DROP TABLE users--",
-            "' UNION SELECT NULL--",
-            "1' AND 1=1--",
-        ]
-
-        for i, payload in enumerate(payloads[:attempts], 1):
+        for i, payload in enumerate(SQLI_PAYLOADS[:attempts], 1):
             try:
-                response = requests.get(
+                response = self._session.get(
                     f"http://{self.web_host}:{self.web_port}/api/users",
                     params={'id': payload},
                     timeout=5
@@ -141,15 +157,9 @@ class AttackSimulator:
         """Simulate credential stuffing attack."""
         print(f"\n[Credential Stuffing] Trying common credentials ({attempts} attempts)...")
 
-        credentials = [
-            ('admin', 'admin123'),
-            ('user', 'password'),
-            ('root', 'toor'),
-        ]
-
-        for i, (user, pwd) in enumerate(credentials[:attempts], 1):
+        for i, (user, pwd) in enumerate(STUFFED_CREDENTIALS[:attempts], 1):
             try:
-                response = requests.post(
+                response = self._session.post(
                     f"http://{self.web_host}:{self.web_port}/login",
                     data={'username': user, 'password': pwd},
                     timeout=5
@@ -162,13 +172,7 @@ class AttackSimulator:
 
     def mixed_attack_pattern(self, intensity='medium'):
         """Run mixed attack pattern based on intensity."""
-        intensity_map = {
-            'low': {'ssh': 2, 'web': 5, 'sqli': 2, 'cred': 1},
-            'medium': {'ssh': 5, 'web': 10, 'sqli': 5, 'cred': 3},
-            'high': {'ssh': 10, 'web': 20, 'sqli': 10, 'cred': 5},
-        }
-
-        params = intensity_map.get(intensity, intensity_map['medium'])
+        params = INTENSITY_MAP.get(intensity, INTENSITY_MAP['medium'])
 
         # Random order to simulate real attacker
         attacks = [
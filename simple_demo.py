@@ -5,7 +5,8 @@ DeceptiCloud Simple Demo - Shows autonomous learning vs static honeypots
 
 import sys
 import os
-sys.path.append(os.getcwd())
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
 
 print("DeceptiCloud Autonomous Learning Demo")
 print("=" * 40)
@@ -92,7 +93,8 @@ except Exception as e:
 # Test 5: Monitoring system
 print("\n5. Testing monitoring system...")
 try:
-    from src.monitoring import monitor
+    from src.monitoring import get_monitor
+    get_monitor()
     print("   SUCCESS: Monitoring system ready for CloudWatch")
     print("   Can track: attacks, rewards, learning progress")
 except Exception as e:
@@ -8,6 +8,12 @@ import requests
 import time
 from collections import deque
 
+# Probe lists are constants, so build them once instead of on every attack
+_COMMON_PORTS = (22, 80, 443, 2222, 8080)
+_SSH_USERNAMES = ('root', 'admin', 'ubuntu')
+_SSH_PASSWORDS = ('admin', 'password', '123456', 'root', 'ubuntu')
+_WEB_SCAN_PATHS = ('/admin', '/login', '/config', '/backup', '/.env', '/robots.txt')
+
 class AdversarialAttacker:
     """
     Adversarial RL agent that learns to attack honeypots
@@ -32,6 +38,9 @@ class AdversarialAttacker:
         self.success_count = 0
         self.detection_count = 0
         
+        # Keep-alive session reused across the web scan's requests
+        self._session = requests.Session()
+        
     def _build_model(self):
         """Build neural network for adversarial learning"""
         model = nn.Sequential(
@@ -63,18 +72,17 @@ class AdversarialAttacker:
     def _measure_response_time(self, host):
         """Measure actual network response time"""
         try:
-            start = time.time()
+            start = time.monotonic()
             response = requests.get(f"http://{host}", timeout=5)
-            return time.time() - start
+            return time.monotonic() - start
         except:
             return 5.0  # Timeout
             
     def _scan_ports(self, host):
         """Real port scanning"""
         open_ports = []
-        common_ports = [22, 80, 443, 2222, 8080]
         
-        for port in common_ports:
+        for port in _COMMON_PORTS:
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(1)
@@ -150,11 +158,8 @@ class AdversarialAttacker:
         
     def _ssh_bruteforce(self, host):
         """Real SSH brute force attack"""
-        passwords = ['admin', 'password', '123456', 'root', 'ubuntu']
-        usernames = ['root', 'admin', 'ubuntu']
-        
-        for username in usernames:
-            for password in passwords:
+        for username in _SSH_USERNAMES:
+            for password in _SSH_PASSWORDS:
                 try:
                     ssh = paramiko.SSHClient()
                     ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -182,12 +187,11 @@ class AdversarialAttacker:
         
     def _web_scan(self, host):
         """Web vulnerability scanning"""
-        paths = ['/admin', '/login', '/config', '/backup', '/.env', '/robots.txt']
         findings = []
         
-        for path in paths:
+        for path in _WEB_SCAN_PATHS:
             try:
-                response = requests.get(f"http://{host}{path}", timeout=5)
+                response = self._session.get(f"http://{host}{path}", timeout=5)
                 if response.status_code == 200:
                     findings.append({
                         'path': path,
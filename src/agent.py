@@ -3,8 +3,36 @@ import torch.nn as nn
 import torch.optim as optim
 import numpy as np
 import random
-from collections import deque
-from .monitoring import monitor
+from .monitoring import get_monitor
+
+class ReplayBuffer:
+    """Fixed-size experience replay stored in preallocated arrays, written as a ring"""
+    def __init__(self, capacity, state_size):
+        self.capacity = capacity
+        self.states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=bool)
+        self._pos = 0  # total writes; the slot is _pos % capacity
+    
+    def __len__(self):
+        return min(self._pos, self.capacity)
+    
+    def append(self, state, action, reward, next_state, done):
+        i = self._pos % self.capacity
+        self.states[i] = np.ravel(state)
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = np.ravel(next_state)
+        self.dones[i] = done
+        self._pos += 1
+    
+    def sample(self, batch_size):
+        """Random minibatch without replacement as (states, actions, rewards, next_states, dones)"""
+        idx = np.random.choice(len(self), batch_size, replace=False)
+        return (self.states[idx], self.actions[idx], self.rewards[idx],
+                self.next_states[idx], self.dones[idx])
 
 class DQNAgent:
     def __init__(self, state_size, action_size):
@@ -12,7 +40,7 @@ class DQNAgent:
         self.action_size = action_size
         
         # Experience Replay
-        self.memory = deque(maxlen=2000)
+        self.memory = ReplayBuffer(2000, state_size)
         
         # Hyperparameters
         self.gamma = 0.95
@@ -58,7 +86,7 @@ class DQNAgent:
         }
 
     def remember(self, state, action, reward, next_state, done):
-        self.memory.append((state, action, reward, next_state, done))
+        self.memory.append(state, action, reward, next_state, done)
         
         # Track when learning actually starts
         if len(self.memory) >= 32 and not self.learning_started:
@@ -96,16 +124,16 @@ class DQNAgent:
         if len(self.memory) < batch_size:
             return
 
-        minibatch = random.sample(self.memory, batch_size)
+        states, actions, rewards, next_states, dones = self.memory.sample(batch_size)
+        states = torch.from_numpy(states)
+        next_states = torch.from_numpy(next_states)
         total_loss = 0
         q_values = []
 
-        for state, action, reward, next_state, done in minibatch:
-            s_arr = np.array(state)
-            ns_arr = np.array(next_state)
-
-            s_tensor = torch.FloatTensor(s_arr).unsqueeze(0) if s_arr.ndim == 1 else torch.FloatTensor(s_arr)
-            ns_tensor = torch.FloatTensor(ns_arr).unsqueeze(0) if ns_arr.ndim == 1 else torch.FloatTensor(ns_arr)
+        for i in range(batch_size):
+            action, reward, done = int(actions[i]), float(rewards[i]), dones[i]
+            s_tensor = states[i:i + 1]
+            ns_tensor = next_states[i:i + 1]
 
             target = self.model(s_tensor).clone().detach()
             current_q_values = self.model(s_tensor).detach().numpy().flatten()
@@ -130,8 +158,8 @@ class DQNAgent:
         
         # Send learning metrics to CloudWatch
         try:
-            avg_loss = total_loss / len(minibatch)
-            monitor.send_learning_metrics(
+            avg_loss = total_loss / batch_size
+            get_monitor().send_learning_metrics(
                 episode=episode,
                 epsilon=self.epsilon,
                 loss=avg_loss,
@@ -30,8 +30,8 @@ class CloudCommandRunner:
             cmd_id = response['Command']['CommandId']
 
             # wait for the command to finish
-            end_time = time.time() + timeout
-            while time.time() < end_time:
+            end_time = time.monotonic() + timeout
+            while time.monotonic() < end_time:
                 invocation = self.ssm.list_command_invocations(
                     CommandId=cmd_id,
                     InstanceId=instance_ids[0],
@@ -2,14 +2,78 @@ import numpy as np
 import paramiko
 import time
 import json
+import logging
+import math
 import os
+import re
+import socket
+import subprocess
+import threading
+from collections import deque
 from . import utils
 from .cloud_control import CloudCommandRunner
 from .local_honeypot_manager import LocalHoneypotManager
 # from .monitoring import monitor  # Optional monitoring
 
+logger = logging.getLogger(__name__)
+
+# Echoed between batched commands so their outputs can be split apart again
+BATCH_DELIMITER = '__DECEPTICLOUD_BATCH__'
+# Echoed after each command sent to the persistent shell to mark the end of its output
+SHELL_SENTINEL = '__DECEPTICLOUD_DONE__'
+
+# Container started by each honeypot action
+HONEYPOT_CONTAINERS = {1: 'cowrie_honeypot', 2: 'web_honeypot'}
+# Remote filters applied to followed container logs; only attacker activity is streamed back
+FOLLOW_FILTERS = {
+    'cowrie_honeypot': "grep --line-buffered -i 'new connection'",
+    'web_honeypot': "grep --line-buffered -E '(GET|POST)'",
+}
+# Remote filter and tail size used when polling each container's logs
+PROBE_FILTERS = {
+    'cowrie_honeypot': ("grep -i 'new connection'", 50),
+    'web_honeypot': ("grep -E '(GET|POST)'", 20),
+}
+# Prints the number of filtered lines, then the last one (for local IP extraction)
+_COUNT_AND_LAST = "awk '{n++; last=$0} END {print n+0; print last}'"
+# How long a container seen running is trusted before it is probed again
+HEALTH_CACHE_TTL = 1.0
+# Remote readiness loop appended to deploy batches: prints 'ready' once the
+# container runs, polling every 0.1s for up to 3s. The subshell keeps the
+# persistent shell alive whatever the loop does.
+READY_WAIT = ("( for i in $(seq 1 30); do "
+              "[ \"$(docker inspect -f '{{{{.State.Running}}}}' {container} 2>/dev/null)\" = true ] "
+              "&& echo ready && break; sleep 0.1; done )")
+# Remote command batch per action, built once; deploys end with the readiness loop
+_STOP_COWRIE = "docker stop cowrie_honeypot || true"
+_STOP_WEB = "docker stop web_honeypot || true"
+ACTION_COMMANDS = {
+    0: (_STOP_COWRIE, _STOP_WEB),
+    1: (_STOP_WEB,
+        "docker run -d --rm -p 2222:2222 --name cowrie_honeypot cowrie/cowrie",
+        READY_WAIT.format(container='cowrie_honeypot')),
+    2: (_STOP_COWRIE,
+        "docker run -d --rm -p 80:80 --name web_honeypot nginx",
+        READY_WAIT.format(container='web_honeypot')),
+}
+_IP_RE = re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b')
+
+
+def _parse_count(output):
+    """Parse the match count line printed by the probe's awk (_COUNT_AND_LAST).
+
+    The awk prints the number of filtered log lines, then the last matching line;
+    this takes the count line, treating anything else as 0.
+    """
+    try:
+        return int((output or '').strip() or 0)
+    except ValueError:
+        return 0
+
+
 class CloudHoneynetEnv:
-    def __init__(self, host, user, key_file, use_ssm=False, ssm_instance_id=None, aws_region=None, dry_run=False):
+    def __init__(self, host, user, key_file, use_ssm=False, ssm_instance_id=None, aws_region=None, dry_run=False,
+                 verbose=False, use_control_master=False, sim_duration=600):
         """Environment that controls honeypots on a cloud VM.
 
         Args:
@@ -19,6 +83,11 @@ class CloudHoneynetEnv:
             use_ssm: If True, use AWS SSM RunCommand to execute commands (preferred on AWS)
             ssm_instance_id: EC2 instance id to target via SSM (required if use_ssm=True)
             aws_region: AWS region for SSM client
+            verbose: If True, log this environment's per-step decisions, detections and rewards
+                at INFO; otherwise at DEBUG
+            use_control_master: If True, run commands with the OpenSSH client over a shared
+                ControlMaster socket instead of paramiko
+            sim_duration: Seconds of simulated attacks started on reset() when host is 'localhost'
         """
         self.host = host
         self.user = user
@@ -26,9 +95,16 @@ class CloudHoneynetEnv:
         self.use_ssm = use_ssm
         self.ssm_instance_id = ssm_instance_id
         self.aws_region = aws_region
+        self.use_control_master = bool(use_control_master) and not use_ssm
+
+        # Per-step chatter logs at INFO only when verbose, otherwise at DEBUG; logger levels
+        # and handlers are left to the application
+        self.verbose = verbose
+        self._step_level = logging.INFO if verbose else logging.DEBUG
 
         self.ssh_client = None
-        if not use_ssm:
+        self._shell = None  # long-lived remote /bin/sh channel, opened after connect
+        if not use_ssm and not self.use_control_master:
             self.ssh_client = paramiko.SSHClient()
             self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
@@ -36,10 +112,19 @@ class CloudHoneynetEnv:
         self.action_size = 3 # [0: None, 1: Cowrie, 2: Web]
         self.current_honeypot = 0 # 0 = None
 
+        # Background 'docker logs -f' readers keyed by container: (channel, events, thread)
+        self._followers = {}
+
+        # Monotonic time each container was last confirmed running; cleared whenever we start/stop containers
+        self._running_seen = {}
+
+        # Monotonic time of the last log poll per container, so polls only fetch new lines
+        self._last_log_poll = {}
+
         self.ssm_runner = None
         if use_ssm:
             if not ssm_instance_id:
-                print("ERROR: use_ssm=True but no ssm_instance_id provided.")
+                logger.error("use_ssm=True but no ssm_instance_id provided.")
             else:
                 self.ssm_runner = CloudCommandRunner(region_name=aws_region)
 
@@ -48,12 +133,15 @@ class CloudHoneynetEnv:
         
         # Initialize local honeypot manager for research validation
         self.honeypot_manager = LocalHoneypotManager()
+        # Set by the manager when the active honeypot sees an attack, ending the step's wait early
+        self._engagement_changed = threading.Event()
+        self.honeypot_manager.on_attack = self._engagement_changed.set
+        self.sim_duration = sim_duration
         if self.host == 'localhost':
-            print("[Environment] Using local honeypot manager for research validation")
-            self.honeypot_manager.simulate_realistic_attacks(duration=600)  # 10 minutes of attacks
+            logger.info("[Environment] Using local honeypot manager for research validation")
 
         # Attempt SSH connect if using SSH
-        if not use_ssm and self.host:
+        if self.ssh_client and self.host:
             try:
                 self.ssh_client.connect(
                     hostname=self.host, 
@@ -65,12 +153,124 @@ class CloudHoneynetEnv:
                     look_for_keys=False,
                     allow_agent=False
                 )
-                print("Successfully connected to EC2 instance via SSH.")
+                logger.info("Successfully connected to EC2 instance via SSH.")
             except Exception as e:
-                print(f"ERROR: Could not connect to EC2 instance via SSH. {e}")
-                print("Please check your EC2_HOST, EC2_USER, and EC2_KEY_FILE variables in main.py")
+                logger.error("Could not connect to EC2 instance via SSH. %s", e)
+                logger.error("Please check your EC2_HOST, EC2_USER, and EC2_KEY_FILE variables in main.py")
                 self.ssh_client = None
 
+            if self.ssh_client is not None:
+                # Connection tuning is best effort; the client works without it
+                try:
+                    transport = self.ssh_client.get_transport()
+                    # Keepalives stop NAT gateways from silently dropping an idle session
+                    transport.set_keepalive(30)
+                    # Small command/sentinel writes must not wait on Nagle's algorithm
+                    transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except Exception as e:
+                    logger.warning("Could not tune the SSH connection: %s", e)
+                self._shell = self._open_shell()
+
+    def _open_shell(self):
+        """Start a non-interactive remote shell that commands are piped through.
+
+        Reusing one channel avoids a channel open per command. Returns None on failure.
+        """
+        try:
+            channel = self.ssh_client.get_transport().open_session()
+            channel.settimeout(30)
+            channel.exec_command('/bin/sh')
+            return channel
+        except Exception as e:
+            logger.warning("Could not open persistent shell, using exec_command: %s", e)
+            return None
+
+    def _close_shell(self):
+        if self._shell is not None:
+            try:
+                self._shell.close()
+            except Exception:
+                pass
+            self._shell = None
+
+    def _send_to_shell(self, cmd):
+        """Send cmd to the persistent shell, followed by the sentinel echo on stdout and stderr."""
+        # stdin is redirected so a command can never swallow the following input
+        self._shell.sendall(f"{{ {cmd}\n}} </dev/null; echo {SHELL_SENTINEL}; echo {SHELL_SENTINEL} >&2\n".encode())
+
+    def _read_shell_output(self):
+        """Read the persistent shell's stdout and stderr, each up to its sentinel, as (stdout, stderr).
+
+        Delimiting stderr too keeps a command's late error output from being
+        reported as the next command's.
+        """
+        channel = self._shell
+        out = self._read_to_sentinel(channel.recv)
+        err = self._read_to_sentinel(channel.recv_stderr)
+        return out.decode(errors='replace'), err.decode(errors='replace')
+
+    @staticmethod
+    def _read_to_sentinel(recv):
+        """Read from recv until a full sentinel line arrives and return what came before it."""
+        marker = SHELL_SENTINEL.encode()
+        buf = bytearray()
+        while True:
+            idx = buf.find(marker)
+            if idx != -1 and buf.find(b'\n', idx) != -1:
+                return bytes(buf[:idx])
+            chunk = recv(65536)
+            if not chunk:
+                raise EOFError('persistent shell closed')
+            buf += chunk
+
+    @staticmethod
+    def _read_channel(channel, bufsize=65536):
+        """Read a finished exec channel to EOF in large chunks and return (stdout, stderr)."""
+        out = []
+        while True:
+            chunk = channel.recv(bufsize)
+            if not chunk:
+                break
+            out.append(chunk)
+        err = []
+        while True:
+            chunk = channel.recv_stderr(bufsize)
+            if not chunk:
+                break
+            err.append(chunk)
+        return b''.join(out).decode(errors='replace'), b''.join(err).decode(errors='replace')
+
+    def _run_ssm(self, commands):
+        """Run a list of commands in a single SSM RunCommand invocation."""
+        success, out, err = self.ssm_runner.run_command(self.ssm_instance_id, commands, timeout=60)
+        if success:
+            return out, ''
+        return '', err
+
+    def _run_control_master(self, cmd):
+        """Run cmd with the system ssh client, multiplexed over one master connection.
+
+        The first call opens the master; later calls reuse its socket and skip the
+        TCP and key-exchange handshakes. The master exits after 60s idle.
+        """
+        args = [
+            "ssh",
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath=/tmp/cc-{os.getpid()}-%h-%p-%r",
+            "-o", "ControlPersist=60s",
+            "-o", "BatchMode=yes",
+            "-o", "StrictHostKeyChecking=accept-new",
+        ]
+        if self.key_file:
+            args += ["-i", self.key_file]
+        args += [f"{self.user}@{self.host}", cmd]
+        try:
+            result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+            return result.stdout, result.stderr
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning("Error executing SSH command: %s", e)
+            return "", str(e)
+
     def _execute_command(self, cmd):
         """Execute a shell command either via SSM or SSH depending on configuration.
 
@@ -78,31 +278,147 @@ class CloudHoneynetEnv:
         """
         # When dry-run is enabled, print the command and skip execution
         if self.dry_run:
-            print(f"[DRY_RUN] Would execute: {cmd}")
+            logger.log(self._step_level, "[DRY_RUN] Would execute: %s", cmd)
             # Return empty output and no error to allow higher-level logic to continue
             return "", ""
 
         if self.use_ssm and self.ssm_runner:
-            success, out, err = self.ssm_runner.run_command(self.ssm_instance_id, [cmd], timeout=60)
-            if success:
-                return out, ''
-            return '', err
+            return self._run_ssm([cmd])
+
+        if self.use_control_master:
+            return self._run_control_master(cmd)
 
         # Fallback to SSH
         if not self.ssh_client:
             return None, 'no ssh client available'
 
+        if self._shell is None or self._shell.closed:
+            # Reopen a persistent shell dropped by an earlier failure
+            self._close_shell()
+            self._shell = self._open_shell()
+
+        if self._shell is not None:
+            try:
+                self._send_to_shell(cmd)
+            except Exception as e:
+                # Nothing reached the remote side, so running it via exec_command is safe
+                logger.warning("Persistent shell failed, falling back to exec_command: %s", e)
+                self._close_shell()
+            else:
+                try:
+                    return self._read_shell_output()
+                except Exception as e:
+                    # The command was sent and may still be running remotely; running it
+                    # again (e.g. a second docker run) is not safe, so report the failure
+                    logger.warning("Error executing SSH command: %s", e)
+                    self._close_shell()
+                    return "", str(e)
+
         try:
             stdin, stdout, stderr = self.ssh_client.exec_command(cmd, timeout=30)
-            stdout_data = stdout.read().decode()
-            stderr_data = stderr.read().decode()
-            return stdout_data, stderr_data
+            return self._read_channel(stdout.channel)
         except Exception as e:
-            print(f"Error executing SSH command: {e}")
+            logger.warning("Error executing SSH command: %s", e)
             return "", str(e)
 
+    def _execute_batch(self, cmds):
+        """Execute several shell commands in a single remote round trip.
+
+        Returns (outputs, stderr) where outputs holds the stdout of each command, in order.
+        """
+        if self.use_ssm and self.ssm_runner and not self.dry_run:
+            # SSM takes a command list natively and runs it as one script in one invocation
+            script = []
+            for cmd in cmds:
+                script += [cmd, f"echo {BATCH_DELIMITER}"]
+            out, err = self._run_ssm(script[:-1])
+        else:
+            script = f" ; echo {BATCH_DELIMITER} ; ".join(cmds)
+            out, err = self._execute_command(script)
+        outputs = (out or '').split(BATCH_DELIMITER + '\n')
+        outputs += [''] * (len(cmds) - len(outputs))
+        return outputs[:len(cmds)], err
+
+    def _recently_running(self, container):
+        seen = self._running_seen.get(container)
+        return seen is not None and time.monotonic() - seen < HEALTH_CACHE_TTL
+
+    def _start_log_follower(self, container):
+        """Stream attacker-activity log lines of container into a local queue.
+
+        One long-running 'docker logs -f' over SSH replaces a remote exec per step.
+        Not available over SSM or in dry-run mode, where _get_state keeps polling.
+        """
+        if self.dry_run or not self.ssh_client:
+            return
+        follower = self._followers.get(container)
+        if follower and follower[2].is_alive():
+            return
+        try:
+            channel = self.ssh_client.get_transport().open_session()
+            channel.exec_command(f"docker logs -f --tail 0 {container} 2>/dev/null | {FOLLOW_FILTERS[container]}")
+        except Exception as e:
+            logger.warning("[Environment] Could not follow %s logs, polling instead: %s", container, e)
+            return
+        events = deque(maxlen=256)
+        thread = threading.Thread(target=self._follow_logs, args=(channel, events), daemon=True)
+        thread.start()
+        self._followers[container] = (channel, events, thread)
+
+    @staticmethod
+    def _follow_logs(channel, events):
+        """Reader thread: append complete log lines until the container stops."""
+        pending = b''
+        try:
+            while True:
+                chunk = channel.recv(65536)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b'\n')
+                events.extend(line.decode(errors='replace') for line in lines if line)
+        except Exception:
+            pass
+        finally:
+            channel.close()
+
+    def _stop_log_followers(self):
+        for channel, _, _ in self._followers.values():
+            try:
+                channel.close()
+            except Exception:
+                pass
+        self._followers = {}
+
+    def _drain_follower(self, container, events):
+        """Consume streamed log lines and return 1 if any attacker activity arrived."""
+        lines = []
+        while events:
+            lines.append(events.popleft())
+        if not lines:
+            return 0
+        ips = _IP_RE.findall(lines[-1])
+        attacker_ip = ips[0] if ips else "unknown"
+        honeypot_type = 'ssh' if container == 'cowrie_honeypot' else 'web'
+        logger.log(self._step_level, "[Environment] Attacker activity detected in %s honeypot", honeypot_type.upper())
+        logger.log(self._step_level, "[CloudWatch] Attack detected from %s on %s honeypot", attacker_ip, honeypot_type.upper())
+        return 1
+
+    def _log_window(self, container, now, tail=50):
+        """Return docker logs options selecting lines written since the previous poll."""
+        last = self._last_log_poll.get(container)
+        if last is None:
+            return f"--tail {tail}"
+        return f"--since {math.ceil(now - last)}s --tail {tail}"
+
+    def _probe_script(self, container, now):
+        """Shell fragment printing the container name, its new-activity count and the last matching line."""
+        log_filter, tail = PROBE_FILTERS[container]
+        return (f"echo {container}; "
+                f"docker logs {self._log_window(container, now, tail)} {container} 2>/dev/null "
+                f"| {log_filter} | {_COUNT_AND_LAST}")
+
     def _get_state(self):
-        print("[Environment] Checking for attacker activity...")
+        logger.debug("[Environment] Checking for attacker activity...")
         attacker_detected = 0
         attacker_details = {}
         
@@ -111,90 +427,110 @@ class CloudHoneynetEnv:
             attacker_detected = self.honeypot_manager.get_attack_detection_state()
             if attacker_detected:
                 metrics = self.honeypot_manager.get_performance_metrics()
-                print(f"[Environment] Attack detected! Total attacks: {metrics['total_attacks']}")
+                logger.log(self._step_level, "[Environment] Attack detected! Total attacks: %s", metrics['total_attacks'])
                 attacker_details = {'detection_method': 'local_simulation', 'metrics': metrics}
-            return np.array([attacker_detected, self.current_honeypot])
+            return self._make_state(attacker_detected)
         
-        # Remote instance detection
-        running_containers, _ = self._execute_command("docker ps --format '{{.Names}}'")
-        if not running_containers:
-            running_containers = ""
+        # With no honeypot deployed both containers were just stopped, so there is nothing to probe
+        if self.current_honeypot == 0:
+            return self._make_state(0)
         
+        # Streamed logs already say whether anything happened, without a remote call
+        container = HONEYPOT_CONTAINERS.get(self.current_honeypot)
+        follower = self._followers.get(container)
+        if follower and follower[2].is_alive():
+            return self._make_state(self._drain_follower(container, follower[1]))
+
+        # Remote instance detection: one script finds the running honeypot, counts its new
+        # log activity and extracts the attacker IP. A container confirmed running a moment
+        # ago needs no docker ps.
+        now = time.monotonic()
+        if container and self._recently_running(container):
+            script = self._probe_script(container, now)
+        else:
+            # Names are space-delimited so only whole container names match
+            script = ("P=\" $(docker ps --format '{{.Names}}' | tr '\\n' ' ')\"; case \"$P\" in "
+                      f"*' cowrie_honeypot '*) {self._probe_script('cowrie_honeypot', now)};; "
+                      f"*' web_honeypot '*) {self._probe_script('web_honeypot', now)};; "
+                      "esac")
+        out, _ = self._execute_command(script)
+        lines = (out or '').splitlines()
+        if not lines or lines[0] not in PROBE_FILTERS:
+            return self._make_state(attacker_detected)
+        running = lines[0]
+        self._last_log_poll[running] = now
+        events = _parse_count(lines[1] if len(lines) > 1 else '')
+        ips = _IP_RE.findall(lines[2]) if len(lines) > 2 else []
+        attacker_ip = ips[0] if ips else "unknown"
+
         # Check for SSH honeypot logs (Cowrie)
-        if 'cowrie_honeypot' in running_containers:
-            # Check Cowrie logs for recent connections with IP extraction
-            log_cmd = "docker logs --tail 50 cowrie_honeypot 2>/dev/null | grep -i 'new connection' | tail -5"
-            log_data, _ = self._execute_command(log_cmd)
-            if log_data and log_data.strip():
+        if running == 'cowrie_honeypot':
+            if events > 0:
                 attacker_detected = 1
-                print(f"[Environment] Attacker activity detected in SSH honeypot")
-                
-                # Extract attacker IP from logs
-                ip_cmd = r"docker logs --tail 10 cowrie_honeypot 2>/dev/null | grep -oE '[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}' | tail -1"
-                attacker_ip, _ = self._execute_command(ip_cmd)
-                attacker_ip = attacker_ip.strip() if attacker_ip else "unknown"
+                logger.log(self._step_level, "[Environment] Attacker activity detected in SSH honeypot")
                 
                 attacker_details = {
                     'ip': attacker_ip,
                     'honeypot_type': 'ssh',
-                    'log_sample': log_data.strip()[-200:]  # Last 200 chars
+                    'events': events
                 }
                 
                 # Optional CloudWatch logging
-                print(f"[CloudWatch] Attack detected from {attacker_ip} on SSH honeypot")
+                logger.log(self._step_level, "[CloudWatch] Attack detected from %s on SSH honeypot", attacker_ip)
         
         # Check for web honeypot access logs
-        elif 'web_honeypot' in running_containers:
-            # Check nginx access logs for recent requests
-            log_cmd = "docker logs --tail 20 web_honeypot 2>/dev/null | grep -E '(GET|POST)' | tail -3"
-            log_data, _ = self._execute_command(log_cmd)
-            if log_data and log_data.strip():
-                attacker_detected = 1
-                print(f"[Environment] Attacker activity detected in web honeypot")
-                
-                # Extract IP from nginx logs
-                ip_cmd = r"docker logs --tail 10 web_honeypot 2>/dev/null | grep -oE '[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}' | tail -1"
-                attacker_ip, _ = self._execute_command(ip_cmd)
-                attacker_ip = attacker_ip.strip() if attacker_ip else "unknown"
-                
-                attacker_details = {
-                    'ip': attacker_ip,
-                    'honeypot_type': 'web',
-                    'log_sample': log_data.strip()[-200:]
-                }
-                
-                # Optional CloudWatch logging
-                print(f"[CloudWatch] Attack detected from {attacker_ip} on web honeypot")
+        elif events > 0:
+            attacker_detected = 1
+            logger.log(self._step_level, "[Environment] Attacker activity detected in web honeypot")
+            
+            attacker_details = {
+                'ip': attacker_ip,
+                'honeypot_type': 'web',
+                'events': events
+            }
+            
+            # Optional CloudWatch logging
+            logger.log(self._step_level, "[CloudWatch] Attack detected from %s on web honeypot", attacker_ip)
         
+        return self._make_state(attacker_detected)
+
+    def _make_state(self, attacker_detected):
+        """Build the observation [attacker_detected, current_honeypot].
+
+        A fresh array each step: callers keep states in the replay memory, so a
+        shared buffer would need copying anyway.
+        """
         return np.array([attacker_detected, self.current_honeypot])
 
     def step(self, action):
         action_names = ['Stop Honeypots', 'Deploy SSH Honeypot', 'Deploy Web Honeypot']
-        print(f"[RL Agent Decision] Action {action}: {action_names[action]}")
+        logger.log(self._step_level, "[RL Agent Decision] Action %s: %s", action, action_names[action])
         
         # Store action for monitoring
         self.last_action = action
         
         # Use local honeypot manager for localhost, otherwise use remote commands
         if self.host == 'localhost' and hasattr(self, 'honeypot_manager'):
+            self._engagement_changed.clear()
             self.honeypot_manager.deploy_honeypot(action)
             self.current_honeypot = action
+            # Allow up to 3s for simulated attacks to be detected, returning as soon as one is
+            self._engagement_changed.wait(timeout=3)
         else:
-            # Remote deployment commands
-            if action == 0: # Do Nothing / Stop Honeypot
-                self._execute_command("docker stop cowrie_honeypot || true")
-                self._execute_command("docker stop web_honeypot || true")
-                self.current_honeypot = 0
-            elif action == 1: # Deploy Cowrie (SSH)
-                self._execute_command("docker stop web_honeypot || true")
-                self._execute_command("docker run -d --rm -p 2222:2222 --name cowrie_honeypot cowrie/cowrie")
-                self.current_honeypot = 1
-            elif action == 2: # Deploy Web Honeypot
-                self._execute_command("docker stop cowrie_honeypot || true")
-                self._execute_command("docker run -d --rm -p 80:80 --name web_honeypot nginx")
-                self.current_honeypot = 2
-
-        time.sleep(3)  # Allow time for deployment and attack detection
+            self._running_seen.clear()
+            # Remote deployment commands: 0 stops both honeypots, 1 deploys Cowrie (SSH), 2 the web honeypot.
+            # Each action is sent as one batch to pay a single SSH/SSM round trip
+            outputs, _ = self._execute_batch(ACTION_COMMANDS[action])
+            self.current_honeypot = action
+
+            # Deploys wait for the container remotely, in the same round trip
+            container = HONEYPOT_CONTAINERS.get(action)
+            if container:
+                if self.dry_run or 'ready' in outputs[-1]:
+                    self._running_seen[container] = time.monotonic()
+                    self._start_log_follower(container)
+                else:
+                    logger.warning("[Environment] %s not running after 3s", container)
 
         next_state = self._get_state()
 
@@ -205,39 +541,58 @@ class CloudHoneynetEnv:
         if attacker_detected == 1:
             if self.current_honeypot == 1:  # SSH honeypot caught attacker
                 reward = 10
-                print(f"[Environment] REWARD +10: SSH honeypot successfully caught attacker")
+                logger.log(self._step_level, "[Environment] REWARD +10: SSH honeypot successfully caught attacker")
             elif self.current_honeypot == 2:  # Web honeypot caught attacker
                 reward = 8
-                print(f"[Environment] REWARD +8: Web honeypot successfully caught attacker")
+                logger.log(self._step_level, "[Environment] REWARD +8: Web honeypot successfully caught attacker")
             else:
                 reward = -5  # Attacker detected but no honeypot running
-                print(f"[Environment] REWARD -5: Attacker detected but no honeypot active")
+                logger.log(self._step_level, "[Environment] REWARD -5: Attacker detected but no honeypot active")
         else:
             if self.current_honeypot != 0:
                 reward = -1  # Running honeypot but no attacker
-                print(f"[Environment] REWARD -1: Honeypot running but no attacker activity")
+                logger.log(self._step_level, "[Environment] REWARD -1: Honeypot running but no attacker activity")
             else:
                 reward = 0  # No honeypot, no attacker - neutral
-                print(f"[Environment] REWARD 0: No activity")
+                logger.log(self._step_level, "[Environment] REWARD 0: No activity")
         
         # Optional CloudWatch metrics
         action_names = ['none', 'ssh', 'web']
-        print(f"[CloudWatch] Reward: {reward}, Action: {action_names[action] if action < len(action_names) else 'unknown'}")
+        logger.log(self._step_level, "[CloudWatch] Reward: %s, Action: %s", reward, action_names[action] if action < len(action_names) else 'unknown')
 
         done = False
         return next_state, reward, done
 
     def reset(self):
-        print("Resetting environment (stopping all honeypots)...")
-        self._execute_command("docker stop cowrie_honeypot || true")
-        self._execute_command("docker stop web_honeypot || true")
+        logger.log(self._step_level, "Resetting environment (stopping all honeypots)...")
+        self._running_seen.clear()
+        self._execute_batch(ACTION_COMMANDS[0])
         self.current_honeypot = 0
-        return np.array([0, self.current_honeypot])
+        # Local attack simulation starts with the first episode rather than at construction
+        if self.host == 'localhost' and not self.honeypot_manager.is_simulating():
+            self.honeypot_manager.simulate_realistic_attacks(duration=self.sim_duration)
+        return self._make_state(0)
+
+    def close(self):
+        """Stop log followers and attack simulation, and close the shell channel and SSH connection."""
+        logger.debug("Closing SSH connection.")
+        self._stop_log_followers()
+        self._close_shell()
+        if self.ssh_client:
+            self.ssh_client.close()
+            # Drop the reference so the paramiko transport thread can be collected right away
+            self.ssh_client = None
+        self.honeypot_manager.stop_simulation()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     def __del__(self):
         try:
-            print("Closing SSH connection.")
-            if self.ssh_client:
-                self.ssh_client.close()
+            self.close()
         except Exception:
             pass
@@ -2,31 +2,66 @@
 Local Honeypot Manager for DeceptiCloud Research
 Manages Docker honeypots and simulates attack detection for research validation
 """
-import requests
+import logging
 import socket
 import time
 import random
 import threading
+from collections import deque
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Attack records kept in memory; older ones are evicted so long simulations stay bounded
+MAX_ATTACK_LOG = 100000
+# Seconds an attack counts as recent activity for the detection state
+RECENT_WINDOW = 30
+# Attack type each honeypot detects, keyed by honeypot id
+HONEYPOT_ATTACK_TYPES = {1: 'ssh', 2: 'web'}
+# Candidate values for simulated attacks, built once instead of on every attack
+_WEB_USERNAMES = ('admin', 'root', 'administrator', 'user')
+_WEB_PASSWORDS = ('password', '123456', 'admin', 'root', 'password123')
+_WEB_SOURCE_IPS = tuple(f'192.168.1.{i}' for i in range(100, 201))
+_SSH_USERNAMES = ('root', 'admin', 'ubuntu', 'user')
+_SSH_SOURCE_IPS = tuple(f'10.0.0.{i}' for i in range(50, 151))
+# Seconds a web honeypot liveness probe result is reused
+WEB_PROBE_TTL = 2.0
+
 class LocalHoneypotManager:
     def __init__(self):
         self.current_honeypot = 0  # 0=none, 1=ssh, 2=web
-        self.attack_log = []
+        self.attack_log = deque(maxlen=MAX_ATTACK_LOG)
+        # Monotonic timestamps of recent attacks per type, pruned from the left as they expire
+        self._recent = {'ssh': deque(), 'web': deque()}
+        # Both the simulation thread (log_attack) and step checks trim these deques
+        self._recent_lock = threading.Lock()
+        # Running totals so metrics don't rescan the log (and survive eviction from it)
+        self._attack_count = 0
+        self._type_counts = {'ssh': 0, 'web': 0}
+        self._detected_count = 0
+        self._source_ips = set()
+        # Background attack simulation and the event that stops it early
+        self._sim_thread = None
+        self._sim_stop = threading.Event()
+        # Optional callable invoked when an attack the active honeypot can detect is logged
+        self.on_attack = None
         self.ssh_port = 2222
         self.web_port = 80
+        self._web_up_cache = (0.0, False)  # (monotonic time of probe, port open)
+        # Keep-alive session for simulated web attacks, created on first use
+        self._session = None
         
     def deploy_honeypot(self, honeypot_type):
         """Deploy specified honeypot type"""
-        print(f"[HoneypotManager] Deploying honeypot type: {honeypot_type}")
+        logger.info("[HoneypotManager] Deploying honeypot type: %s", honeypot_type)
         self.current_honeypot = honeypot_type
         
         if honeypot_type == 1:
-            print("[HoneypotManager] SSH Honeypot (Cowrie) active on port 2222")
+            logger.info("[HoneypotManager] SSH Honeypot (Cowrie) active on port 2222")
         elif honeypot_type == 2:
-            print("[HoneypotManager] Web Honeypot active on port 80")
+            logger.info("[HoneypotManager] Web Honeypot active on port 80")
         else:
-            print("[HoneypotManager] All honeypots stopped")
+            logger.info("[HoneypotManager] All honeypots stopped")
     
     def check_ssh_honeypot(self):
         """Check if SSH honeypot is accessible and has recent activity"""
@@ -38,10 +73,7 @@ class LocalHoneypotManager:
             
             if result == 0:
                 # Check for recent SSH attacks in logs
-                recent_attacks = [a for a in self.attack_log 
-                                if a['type'] == 'ssh' and 
-                                (datetime.now() - a['timestamp']).seconds < 30]
-                return len(recent_attacks) > 0
+                return self._has_recent('ssh')
         except:
             pass
         return False
@@ -49,17 +81,41 @@ class LocalHoneypotManager:
     def check_web_honeypot(self):
         """Check if web honeypot is accessible and has recent activity"""
         try:
-            response = requests.get(f'http://localhost:{self.web_port}', timeout=2)
-            if response.status_code == 200:
+            if self._web_port_open():
                 # Check for recent web attacks
-                recent_attacks = [a for a in self.attack_log 
-                                if a['type'] == 'web' and 
-                                (datetime.now() - a['timestamp']).seconds < 30]
-                return len(recent_attacks) > 0
+                return self._has_recent('web')
         except:
             pass
         return False
     
+    def _has_recent(self, attack_type):
+        """True if an attack of this type was logged within RECENT_WINDOW seconds"""
+        recent = self._recent[attack_type]
+        with self._recent_lock:
+            self._trim_recent(recent, time.monotonic())
+            return bool(recent)
+    
+    @staticmethod
+    def _trim_recent(recent, now):
+        """Drop timestamps older than RECENT_WINDOW from the front of a per-type deque"""
+        while recent and now - recent[0] >= RECENT_WINDOW:
+            recent.popleft()
+    
+    def _web_port_open(self):
+        """TCP connect probe of the web port, cached briefly since it rarely changes between steps"""
+        checked_at, is_open = self._web_up_cache
+        now = time.monotonic()
+        if now - checked_at < WEB_PROBE_TTL:
+            return is_open
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(2)
+        try:
+            is_open = sock.connect_ex(('localhost', self.web_port)) == 0
+        finally:
+            sock.close()
+        self._web_up_cache = (now, is_open)
+        return is_open
+    
     def log_attack(self, attack_type, source_ip, details):
         """Log detected attack for research analysis"""
         attack_record = {
@@ -70,7 +126,21 @@ class LocalHoneypotManager:
             'honeypot_active': self.current_honeypot
         }
         self.attack_log.append(attack_record)
-        print(f"[HoneypotManager] Attack logged: {attack_type} from {source_ip}")
+        self._attack_count += 1
+        if attack_type in self._recent:
+            # Trimmed here too, so the deque stays bounded even when nothing checks it
+            recent = self._recent[attack_type]
+            now = time.monotonic()
+            with self._recent_lock:
+                self._trim_recent(recent, now)
+                recent.append(now)
+            self._type_counts[attack_type] += 1
+        if self.current_honeypot > 0:
+            self._detected_count += 1
+        self._source_ips.add(source_ip)
+        if self.on_attack and HONEYPOT_ATTACK_TYPES.get(self.current_honeypot) == attack_type:
+            self.on_attack()
+        logger.info("[HoneypotManager] Attack logged: %s from %s", attack_type, source_ip)
     
     def get_attack_detection_state(self):
         """Get current attack detection state for RL agent"""
@@ -83,14 +153,16 @@ class LocalHoneypotManager:
     
     def simulate_realistic_attacks(self, duration=300):
         """Simulate realistic attack patterns for research validation"""
+        stop = self._sim_stop = threading.Event()
+        
         def attack_thread():
             attack_patterns = [
                 {'type': 'web', 'frequency': 0.3, 'burst': True},
                 {'type': 'ssh', 'frequency': 0.2, 'burst': False}
             ]
             
-            end_time = time.time() + duration
-            while time.time() < end_time:
+            end_time = time.monotonic() + duration
+            while not stop.is_set() and time.monotonic() < end_time:
                 for pattern in attack_patterns:
                     if random.random() < pattern['frequency']:
                         if pattern['type'] == 'web':
@@ -98,27 +170,40 @@ class LocalHoneypotManager:
                         elif pattern['type'] == 'ssh':
                             self._simulate_ssh_attack()
                 
-                time.sleep(random.uniform(2, 8))
+                stop.wait(random.uniform(2, 8))
         
-        thread = threading.Thread(target=attack_thread, daemon=True)
-        thread.start()
-        print("[HoneypotManager] Realistic attack simulation started")
+        self._sim_thread = threading.Thread(target=attack_thread, daemon=True)
+        self._sim_thread.start()
+        logger.info("[HoneypotManager] Realistic attack simulation started")
+    
+    def is_simulating(self):
+        """True while the attack simulation thread is running"""
+        return self._sim_thread is not None and self._sim_thread.is_alive()
+    
+    def stop_simulation(self):
+        """Stop the attack simulation; the thread exits at its next wait"""
+        self._sim_stop.set()
+    
+    def _get_session(self):
+        """Pooled requests session; requests is only imported once the web simulation runs"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        return self._session
     
     def _simulate_web_attack(self):
         """Simulate web-based attacks"""
         try:
-            usernames = ['admin', 'root', 'administrator', 'user']
-            passwords = ['password', '123456', 'admin', 'root', 'password123']
-            
             data = {
-                'username': random.choice(usernames),
-                'password': random.choice(passwords)
+                'username': random.choice(_WEB_USERNAMES),
+                'password': random.choice(_WEB_PASSWORDS)
             }
             
-            response = requests.post(f'http://localhost:{self.web_port}/login', 
-                                   data=data, timeout=5)
+            response = self._get_session().post(f'http://localhost:{self.web_port}/login', 
+                                              data=data, timeout=5)
             
-            self.log_attack('web', '192.168.1.' + str(random.randint(100, 200)), 
+            self.log_attack('web', random.choice(_WEB_SOURCE_IPS), 
                           f"Login attempt: {data['username']}/{data['password']}")
             
         except Exception as e:
@@ -128,26 +213,24 @@ class LocalHoneypotManager:
         """Simulate SSH-based attacks"""
         try:
             # Just log the attack attempt (SSH honeypot simulation)
-            usernames = ['root', 'admin', 'ubuntu', 'user']
-            self.log_attack('ssh', '10.0.0.' + str(random.randint(50, 150)), 
-                          f"SSH brute force attempt: {random.choice(usernames)}")
+            self.log_attack('ssh', random.choice(_SSH_SOURCE_IPS), 
+                          f"SSH brute force attempt: {random.choice(_SSH_USERNAMES)}")
         except Exception as e:
             pass
     
     def get_performance_metrics(self):
         """Get performance metrics for research analysis"""
-        total_attacks = len(self.attack_log)
-        web_attacks = len([a for a in self.attack_log if a['type'] == 'web'])
-        ssh_attacks = len([a for a in self.attack_log if a['type'] == 'ssh'])
+        web_attacks = self._type_counts['web']
+        ssh_attacks = self._type_counts['ssh']
+        total_attacks = self._attack_count
         
         # Calculate detection effectiveness
-        detected_attacks = len([a for a in self.attack_log if a['honeypot_active'] > 0])
-        detection_rate = detected_attacks / max(1, total_attacks)
+        detection_rate = self._detected_count / max(1, total_attacks)
         
         return {
             'total_attacks': total_attacks,
             'web_attacks': web_attacks,
             'ssh_attacks': ssh_attacks,
             'detection_rate': detection_rate,
-            'unique_ips': len(set(a['source_ip'] for a in self.attack_log))
+            'unique_ips': len(self._source_ips)
         }
\ No newline at end of file
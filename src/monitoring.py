@@ -1,21 +1,190 @@
+import atexit
 import boto3
+import html
+from botocore.config import Config
 import json
+import threading
 import time
-from datetime import datetime, timedelta
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any
-import logging
+
+# Shared by all monitor clients: a larger keep-alive connection pool and bounded retries
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 2, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Learning metrics read back by get_learning_progress
+LEARNING_METRICS = ('EpisodeReward', 'Epsilon', 'Loss', 'AvgQValue')
+
+# Dashboard stylesheet; passed into DASHBOARD_TEMPLATE as a field since CSS is full of braces
+DASHBOARD_STYLE = """
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .metric-box { border: 1px solid #ccc; padding: 15px; margin: 10px; border-radius: 5px; }
+                .attack-ip { color: red; font-weight: bold; }
+                .reward { color: green; }
+                table { border-collapse: collapse; width: 100%; }
+                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                th { background-color: #f2f2f2; }
+"""
+
+# Dashboard page; filled with str.format, so literal braces must be doubled
+DASHBOARD_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>DeceptiCloud Dashboard</title>
+            <style>{style}            </style>
+        </head>
+        <body>
+            <h1>DeceptiCloud Real-Time Dashboard</h1>
+            <p>Last updated: {updated}</p>
+            
+            <div class="metric-box">
+                <h2>Attack Summary (Last 24h)</h2>
+                <p><strong>Total Attacks:</strong> {total_attacks}</p>
+                <p><strong>Unique Attackers:</strong> {unique_attackers}</p>
+                <p><strong>Attacker IPs:</strong></p>
+                <ul>
+                    {ip_items}
+                </ul>
+                
+                <h3>Attack Types</h3>
+                <table>
+                    <tr><th>Type</th><th>Count</th></tr>
+                    {type_rows}
+                </table>
+                
+                <h3>Honeypot Usage</h3>
+                <table>
+                    <tr><th>Honeypot</th><th>Attacks</th></tr>
+                    {usage_rows}
+                </table>
+            </div>
+            
+            <div class="metric-box">
+                <h2>Recent Attacks</h2>
+                <table>
+                    <tr><th>Time</th><th>IP</th><th>Type</th><th>Honeypot</th><th>Success</th></tr>
+                    {recent_rows}
+                </table>
+            </div>
+            
+            <div class="metric-box">
+                <h2>Learning Progress</h2>
+                <p>Current learning metrics from the RL agent:</p>
+                <ul>
+                    <li>Episode Rewards: {reward_points} data points</li>
+                    <li>Epsilon (Exploration): {epsilon_points} data points</li>
+                    <li>Training Loss: {loss_points} data points</li>
+                    <li>Q-Values: {q_points} data points</li>
+                </ul>
+            </div>
+        </body>
+        </html>
+        """
+
+# PutMetricData accepts at most 1000 datums per call
+METRIC_BATCH_SIZE = 1000
+# Seconds buffered metrics may wait before being sent
+METRIC_FLUSH_INTERVAL = 10.0
+# Log events sent per PutLogEvents call (the API allows 10,000 / 1MB)
+LOG_BATCH_SIZE = 500
+# Seconds buffered log events may wait before being sent
+LOG_FLUSH_INTERVAL = 2.0
+# Events kept per stream if CloudWatch Logs falls behind; the oldest are dropped beyond this
+MAX_BUFFERED_LOG_EVENTS = 10000
 
 class DeceptiCloudMonitor:
     def __init__(self, region='us-east-1'):
-        self.cloudwatch = boto3.client('cloudwatch', region_name=region)
-        self.logs_client = boto3.client('logs', region_name=region)
-        self.ec2_client = boto3.client('ec2', region_name=region)
+        # One session resolves credentials once for all three clients
+        session = boto3.Session(region_name=region)
+        self.cloudwatch = session.client('cloudwatch', config=BOTO_CONFIG)
+        self.logs_client = session.client('logs', config=BOTO_CONFIG)
+        self.ec2_client = session.client('ec2', config=BOTO_CONFIG)
         self.log_group = '/decepticloud/honeypot'
         self.metrics_namespace = 'DeceptiCloud'
         
+        # Metric datums are buffered and sent in batches by flush_metrics()
+        self._metric_buffer = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        # Attack log events buffered per log stream, sent in batches by flush_logs()
+        self._log_buffer = {}
+        self._log_lock = threading.Lock()
+        # Running attack aggregates for events sent by this process, so a local summary can
+        # skip a CloudWatch Logs scan; _agg_started is the monotonic time of the first event
+        self._agg_lock = threading.Lock()
+        self._agg_started = None
+        self._agg_total = 0
+        self._agg_ips = set()
+        self._agg_types = Counter()
+        self._agg_usage = Counter()
+        self._agg_recent = deque(maxlen=10)
+        # Daily log stream name, rebuilt only when the date changes
+        self._stream_day = None
+        self._stream_name = None
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+    
+    def _enqueue_metrics(self, datums):
+        """Buffer metric datums, flushing once a full batch or the flush interval is reached"""
+        # Stamp now, since the datums may be sent several seconds later
+        now = datetime.now(timezone.utc)
+        for datum in datums:
+            datum['Timestamp'] = now
+        with self._buffer_lock:
+            self._metric_buffer.extend(datums)
+            due = (len(self._metric_buffer) >= METRIC_BATCH_SIZE or
+                   time.monotonic() - self._last_flush > METRIC_FLUSH_INTERVAL)
+        if due:
+            self.flush_metrics()
+    
+    def flush_metrics(self):
+        """Send all buffered metric datums, METRIC_BATCH_SIZE per call"""
+        with self._buffer_lock:
+            batch, self._metric_buffer = self._metric_buffer, []
+            self._last_flush = time.monotonic()
+        for i in range(0, len(batch), METRIC_BATCH_SIZE):
+            try:
+                self.cloudwatch.put_metric_data(
+                    Namespace=self.metrics_namespace,
+                    MetricData=batch[i:i + METRIC_BATCH_SIZE]
+                )
+            except Exception as e:
+                print(f"Failed to send metrics: {e}")
+    
+    def flush_logs(self):
+        """Send all buffered log events, LOG_BATCH_SIZE per call and in time order"""
+        with self._log_lock:
+            pending, self._log_buffer = self._log_buffer, {}
+        for stream, events in pending.items():
+            events = sorted(events, key=lambda e: e['timestamp'])
+            for i in range(0, len(events), LOG_BATCH_SIZE):
+                try:
+                    self.logs_client.put_log_events(
+                        logGroupName=self.log_group,
+                        logStreamName=stream,
+                        logEvents=events[i:i + LOG_BATCH_SIZE]
+                    )
+                except Exception as e:
+                    print(f"Failed to send log event: {e}")
+    
+    def flush(self):
+        """Send everything buffered"""
+        self.flush_logs()
+        self.flush_metrics()
+    
+    def _flush_loop(self):
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL)
+            self.flush_logs()
+            if time.monotonic() - self._last_flush > METRIC_FLUSH_INTERVAL:
+                self.flush_metrics()
+        
     def setup_cloudwatch_logging(self):
         """Create CloudWatch log group for honeypot events"""
         try:
@@ -27,137 +196,164 @@ class DeceptiCloudMonitor:
     def send_attack_event(self, attacker_ip: str, attack_type: str, honeypot_type: str, 
                          success: bool, details: Dict[str, Any]):
         """Send attack event to CloudWatch"""
-        timestamp = int(time.time() * 1000)
+        # One clock read, so the event timestamp, the message time and the daily stream agree
+        ts_ns = time.time_ns()
+        now = datetime.fromtimestamp(ts_ns / 1e9)
+        timestamp = ts_ns // 1_000_000
         
         # Send to CloudWatch Logs
+        event = {
+            'event_type': 'attack',
+            'attacker_ip': attacker_ip,
+            'attack_type': attack_type,
+            'honeypot_type': honeypot_type,
+            'success': success,
+            'details': details,
+            'timestamp': now.isoformat()
+        }
         log_event = {
             'timestamp': timestamp,
-            'message': json.dumps({
-                'event_type': 'attack',
-                'attacker_ip': attacker_ip,
-                'attack_type': attack_type,
-                'honeypot_type': honeypot_type,
-                'success': success,
-                'details': details,
-                'timestamp': datetime.now().isoformat()
-            })
+            'message': json.dumps(event)
         }
         
-        try:
-            self.logs_client.put_log_events(
-                logGroupName=self.log_group,
-                logStreamName=f"attacks-{datetime.now().strftime('%Y-%m-%d')}",
-                logEvents=[log_event]
-            )
-        except Exception as e:
-            print(f"Failed to send log event: {e}")
+        with self._agg_lock:
+            if self._agg_started is None:
+                self._agg_started = time.monotonic()
+            self._agg_total += 1
+            self._agg_ips.add(attacker_ip)
+            self._agg_types[attack_type] += 1
+            self._agg_usage[honeypot_type] += 1
+            self._agg_recent.append(event)
+        
+        if now.date() != self._stream_day:
+            self._stream_day = now.date()
+            self._stream_name = f"attacks-{self._stream_day.isoformat()}"
+        stream = self._stream_name
+        with self._log_lock:
+            events = self._log_buffer.get(stream)
+            if events is None:
+                events = self._log_buffer[stream] = deque(maxlen=MAX_BUFFERED_LOG_EVENTS)
+            events.append(log_event)
+            due = len(events) >= LOG_BATCH_SIZE
+        if due:
+            self.flush_logs()
         
         # Send metrics to CloudWatch
-        self.cloudwatch.put_metric_data(
-            Namespace=self.metrics_namespace,
-            MetricData=[
-                {
-                    'MetricName': 'AttackCount',
-                    'Dimensions': [
-                        {'Name': 'AttackType', 'Value': attack_type},
-                        {'Name': 'HoneypotType', 'Value': honeypot_type}
-                    ],
-                    'Value': 1,
-                    'Unit': 'Count'
-                },
-                {
-                    'MetricName': 'AttackSuccess',
-                    'Dimensions': [
-                        {'Name': 'AttackerIP', 'Value': attacker_ip}
-                    ],
-                    'Value': 1 if success else 0,
-                    'Unit': 'Count'
-                }
-            ]
-        )
+        self._enqueue_metrics([
+            {
+                'MetricName': 'AttackCount',
+                'Dimensions': [
+                    {'Name': 'AttackType', 'Value': attack_type},
+                    {'Name': 'HoneypotType', 'Value': honeypot_type}
+                ],
+                'Value': 1,
+                'Unit': 'Count'
+            },
+            {
+                'MetricName': 'AttackSuccess',
+                'Dimensions': [
+                    {'Name': 'AttackerIP', 'Value': attacker_ip}
+                ],
+                'Value': 1 if success else 0,
+                'Unit': 'Count'
+            }
+        ])
     
     def send_reward_metric(self, episode: int, reward: float, action: str):
         """Send RL reward metrics to CloudWatch"""
-        self.cloudwatch.put_metric_data(
-            Namespace=self.metrics_namespace,
-            MetricData=[
-                {
-                    'MetricName': 'EpisodeReward',
-                    'Dimensions': [{'Name': 'Episode', 'Value': str(episode)}],
-                    'Value': reward,
-                    'Unit': 'None'
-                },
-                {
-                    'MetricName': 'ActionTaken',
-                    'Dimensions': [{'Name': 'Action', 'Value': action}],
-                    'Value': 1,
-                    'Unit': 'Count'
-                }
-            ]
-        )
+        self._enqueue_metrics([
+            {
+                'MetricName': 'EpisodeReward',
+                'Dimensions': [{'Name': 'Episode', 'Value': str(episode)}],
+                'Value': reward,
+                'Unit': 'None'
+            },
+            {
+                'MetricName': 'ActionTaken',
+                'Dimensions': [{'Name': 'Action', 'Value': action}],
+                'Value': 1,
+                'Unit': 'Count'
+            }
+        ])
     
     def send_learning_metrics(self, episode: int, epsilon: float, loss: float, q_values: List[float]):
         """Send learning progress metrics"""
-        self.cloudwatch.put_metric_data(
-            Namespace=self.metrics_namespace,
-            MetricData=[
-                {
-                    'MetricName': 'Epsilon',
-                    'Value': epsilon,
-                    'Unit': 'None'
-                },
-                {
-                    'MetricName': 'Loss',
-                    'Value': loss,
-                    'Unit': 'None'
-                },
-                {
-                    'MetricName': 'AvgQValue',
-                    'Value': sum(q_values) / len(q_values) if q_values else 0,
-                    'Unit': 'None'
-                }
-            ]
-        )
+        self._enqueue_metrics([
+            {
+                'MetricName': 'Epsilon',
+                'Value': epsilon,
+                'Unit': 'None'
+            },
+            {
+                'MetricName': 'Loss',
+                'Value': loss,
+                'Unit': 'None'
+            },
+            {
+                'MetricName': 'AvgQValue',
+                'Value': sum(q_values) / len(q_values) if q_values else 0,
+                'Unit': 'None'
+            }
+        ])
     
-    def get_attack_summary(self, hours: int = 24) -> Dict[str, Any]:
-        """Get attack summary from CloudWatch logs"""
+    def get_attack_summary(self, hours: int = 24, source: str = 'cloudwatch') -> Dict[str, Any]:
+        """Get attack summary from CloudWatch logs.
+
+        With source='local', returns the in-memory aggregates instead, which skip the
+        CloudWatch scan but only count attacks sent by this process. They are used only
+        while all of them fall inside the window; otherwise CloudWatch is scanned.
+        """
+        with self._agg_lock:
+            if (source == 'local' and self._agg_started is not None
+                    and time.monotonic() - self._agg_started <= hours * 3600):
+                return {
+                    'total_attacks': self._agg_total,
+                    'unique_attackers': len(self._agg_ips),
+                    'attacker_ips': list(self._agg_ips),
+                    'attack_types': dict(self._agg_types),
+                    'honeypot_usage': dict(self._agg_usage),
+                    'recent_attacks': list(self._agg_recent)
+                }
+        
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
         try:
-            response = self.logs_client.filter_log_events(
+            # A single filter_log_events call returns only the first page of matches
+            paginator = self.logs_client.get_paginator('filter_log_events')
+            pages = paginator.paginate(
                 logGroupName=self.log_group,
                 startTime=int(start_time.timestamp() * 1000),
                 endTime=int(end_time.timestamp() * 1000),
-                filterPattern='{ $.event_type = "attack" }'
+                filterPattern='{ $.event_type = "attack" }',
+                PaginationConfig={'PageSize': 10000}
             )
             
             attacks = []
-            for event in response['events']:
-                try:
-                    data = json.loads(event['message'])
-                    attacks.append(data)
-                except json.JSONDecodeError:
-                    continue
+            for page in pages:
+                for event in page['events']:
+                    try:
+                        data = json.loads(event['message'])
+                        attacks.append(data)
+                    except json.JSONDecodeError:
+                        continue
             
-            # Analyze attacks
-            unique_ips = set(attack['attacker_ip'] for attack in attacks)
-            attack_types = {}
-            honeypot_usage = {}
+            # Analyze attacks in a single pass
+            unique_ips = set()
+            attack_types = Counter()
+            honeypot_usage = Counter()
             
             for attack in attacks:
-                attack_type = attack['attack_type']
-                honeypot_type = attack['honeypot_type']
-                
-                attack_types[attack_type] = attack_types.get(attack_type, 0) + 1
-                honeypot_usage[honeypot_type] = honeypot_usage.get(honeypot_type, 0) + 1
+                unique_ips.add(attack['attacker_ip'])
+                attack_types[attack['attack_type']] += 1
+                honeypot_usage[attack['honeypot_type']] += 1
             
             return {
                 'total_attacks': len(attacks),
                 'unique_attackers': len(unique_ips),
                 'attacker_ips': list(unique_ips),
-                'attack_types': attack_types,
-                'honeypot_usage': honeypot_usage,
+                'attack_types': dict(attack_types),
+                'honeypot_usage': dict(honeypot_usage),
                 'recent_attacks': attacks[-10:]  # Last 10 attacks
             }
         except Exception as e:
@@ -169,25 +365,30 @@ class DeceptiCloudMonitor:
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
-        metrics = {}
-        for metric_name in ['EpisodeReward', 'Epsilon', 'Loss', 'AvgQValue']:
-            try:
-                response = self.cloudwatch.get_metric_statistics(
-                    Namespace=self.metrics_namespace,
-                    MetricName=metric_name,
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=300,  # 5 minutes
-                    Statistics=['Average']
-                )
-                
-                values = [(point['Timestamp'], point['Average']) 
-                         for point in response['Datapoints']]
-                values.sort(key=lambda x: x[0])
-                metrics[metric_name] = values
-            except Exception as e:
-                print(f"Error getting {metric_name}: {e}")
-                metrics[metric_name] = []
+        # One GetMetricData query per metric, all fetched together; query ids must start lowercase
+        queries = [
+            {
+                'Id': f'm{i}',
+                'Label': metric_name,
+                'MetricStat': {
+                    'Metric': {'Namespace': self.metrics_namespace, 'MetricName': metric_name},
+                    'Period': 300,  # 5 minutes
+                    'Stat': 'Average'
+                }
+            }
+            for i, metric_name in enumerate(LEARNING_METRICS)
+        ]
+        
+        metrics = {metric_name: [] for metric_name in LEARNING_METRICS}
+        try:
+            paginator = self.cloudwatch.get_paginator('get_metric_data')
+            for page in paginator.paginate(MetricDataQueries=queries, StartTime=start_time,
+                                           EndTime=end_time, ScanBy='TimestampAscending'):
+                for result in page['MetricDataResults']:
+                    metric_name = LEARNING_METRICS[int(result['Id'][1:])]
+                    metrics[metric_name].extend(zip(result['Timestamps'], result['Values']))
+        except Exception as e:
+            print(f"Error getting learning metrics: {e}")
         
         return metrics
     
@@ -195,69 +396,37 @@ class DeceptiCloudMonitor:
         """Create HTML dashboard showing all metrics"""
         attack_summary = self.get_attack_summary()
         learning_metrics = self.get_learning_progress()
+        esc = html.escape
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>DeceptiCloud Dashboard</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .metric-box {{ border: 1px solid #ccc; padding: 15px; margin: 10px; border-radius: 5px; }}
-                .attack-ip {{ color: red; font-weight: bold; }}
-                .reward {{ color: green; }}
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <h1>DeceptiCloud Real-Time Dashboard</h1>
-            <p>Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            
-            <div class="metric-box">
-                <h2>Attack Summary (Last 24h)</h2>
-                <p><strong>Total Attacks:</strong> {attack_summary.get('total_attacks', 0)}</p>
-                <p><strong>Unique Attackers:</strong> {attack_summary.get('unique_attackers', 0)}</p>
-                <p><strong>Attacker IPs:</strong></p>
-                <ul>
-                    {''.join(f'<li class="attack-ip">{ip}</li>' for ip in attack_summary.get('attacker_ips', []))}
-                </ul>
-                
-                <h3>Attack Types</h3>
-                <table>
-                    <tr><th>Type</th><th>Count</th></tr>
-                    {''.join(f'<tr><td>{k}</td><td>{v}</td></tr>' for k, v in attack_summary.get('attack_types', {}).items())}
-                </table>
-                
-                <h3>Honeypot Usage</h3>
-                <table>
-                    <tr><th>Honeypot</th><th>Attacks</th></tr>
-                    {''.join(f'<tr><td>{k}</td><td>{v}</td></tr>' for k, v in attack_summary.get('honeypot_usage', {}).items())}
-                </table>
-            </div>
-            
-            <div class="metric-box">
-                <h2>Recent Attacks</h2>
-                <table>
-                    <tr><th>Time</th><th>IP</th><th>Type</th><th>Honeypot</th><th>Success</th></tr>
-                    {''.join(f'<tr><td>{attack.get("timestamp", "")}</td><td class="attack-ip">{attack.get("attacker_ip", "")}</td><td>{attack.get("attack_type", "")}</td><td>{attack.get("honeypot_type", "")}</td><td>{attack.get("success", "")}</td></tr>' for attack in attack_summary.get('recent_attacks', []))}
-                </table>
-            </div>
-            
-            <div class="metric-box">
-                <h2>Learning Progress</h2>
-                <p>Current learning metrics from the RL agent:</p>
-                <ul>
-                    <li>Episode Rewards: {len(learning_metrics.get('EpisodeReward', []))} data points</li>
-                    <li>Epsilon (Exploration): {len(learning_metrics.get('Epsilon', []))} data points</li>
-                    <li>Training Loss: {len(learning_metrics.get('Loss', []))} data points</li>
-                    <li>Q-Values: {len(learning_metrics.get('AvgQValue', []))} data points</li>
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
+        # Attacker-controlled values are escaped; rows are collected and joined once
+        ip_items = ''.join([f'<li class="attack-ip">{esc(str(ip))}</li>'
+                            for ip in attack_summary.get('attacker_ips', [])])
+        type_rows = ''.join([f'<tr><td>{esc(str(k))}</td><td>{v}</td></tr>'
+                             for k, v in attack_summary.get('attack_types', {}).items()])
+        usage_rows = ''.join([f'<tr><td>{esc(str(k))}</td><td>{v}</td></tr>'
+                              for k, v in attack_summary.get('honeypot_usage', {}).items()])
+        recent_rows = []
+        for attack in attack_summary.get('recent_attacks', []):
+            cells = [esc(str(attack.get(key, ''))) for key in
+                     ('timestamp', 'attacker_ip', 'attack_type', 'honeypot_type', 'success')]
+            recent_rows.append('<tr><td>{}</td><td class="attack-ip">{}</td><td>{}</td>'
+                               '<td>{}</td><td>{}</td></tr>'.format(*cells))
+        recent_rows = ''.join(recent_rows)
+        
+        html_content = DASHBOARD_TEMPLATE.format(
+            style=DASHBOARD_STYLE,
+            updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_attacks=attack_summary.get('total_attacks', 0),
+            unique_attackers=attack_summary.get('unique_attackers', 0),
+            ip_items=ip_items,
+            type_rows=type_rows,
+            usage_rows=usage_rows,
+            recent_rows=recent_rows,
+            reward_points=len(learning_metrics.get('EpisodeReward', [])),
+            epsilon_points=len(learning_metrics.get('Epsilon', [])),
+            loss_points=len(learning_metrics.get('Loss', [])),
+            q_points=len(learning_metrics.get('AvgQValue', []))
+        )
         
         with open(save_path, 'w') as f:
             f.write(html_content)
@@ -265,5 +434,18 @@ class DeceptiCloudMonitor:
         print(f"Dashboard saved to {save_path}")
         return save_path
 
-# Global monitor instance
-monitor = DeceptiCloudMonitor()
\ No newline at end of file
+# Shared monitor instance, created on first use so importing this module makes no AWS clients
+_monitor = None
+
+def get_monitor() -> DeceptiCloudMonitor:
+    """Return the shared DeceptiCloudMonitor, creating it on first call"""
+    global _monitor
+    if _monitor is None:
+        _monitor = DeceptiCloudMonitor()
+    return _monitor
+
+def __getattr__(name):
+    # Keeps 'from .monitoring import monitor' working, lazily
+    if name == 'monitor':
+        return get_monitor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
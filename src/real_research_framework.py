@@ -1,15 +1,25 @@
 import numpy as np
 import pandas as pd
 import json
+import logging
 import time
 import re
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
-from .monitoring import monitor
 from .environment import CloudHoneynetEnv
 from .agent import DQNAgent
 
+logger = logging.getLogger(__name__)
+
+# Seconds a Cowrie log fetch is reused before the container is asked for newer lines
+COWRIE_CACHE_TTL = 5.0
+
+_TIMESTAMP_RE = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})')
+
 class RealDeceptiCloudFramework:
+    ACTION_NAMES = ('None', 'SSH', 'Web')
+    
     def __init__(self, ec2_host: str, ec2_user: str, ec2_key: str):
         self.ec2_host = ec2_host
         self.ec2_user = ec2_user
@@ -28,6 +38,14 @@ class RealDeceptiCloudFramework:
             'T1021': {'name': 'Remote Services', 'frequency': 0.08, 'ssh_effectiveness': 0.7, 'web_effectiveness': 0.3},
             'T1505': {'name': 'Server Software Component', 'frequency': 0.05, 'ssh_effectiveness': 0.2, 'web_effectiveness': 0.9}
         }
+        # Technique ids, sampling frequencies and per-action detection probabilities as arrays,
+        # built once; detection columns are indexed by action (0: none, 1: SSH, 2: web)
+        self._tech_ids = tuple(self.mitre_techniques)
+        self._tech_index = {tid: i for i, tid in enumerate(self._tech_ids)}
+        self._tech_freq = np.array([d['frequency'] for d in self.mitre_techniques.values()])
+        self._tech_freq /= self._tech_freq.sum()
+        self._detect_prob = np.array([[0.05, d['ssh_effectiveness'], d['web_effectiveness']]
+                                      for d in self.mitre_techniques.values()])
         
         # Cowrie log patterns for real attack detection
         self.cowrie_patterns = {
@@ -38,41 +56,64 @@ class RealDeceptiCloudFramework:
             'file_download': r'Saved redir contents.*to (.+)',
             'session_close': r'Connection lost after ([0-9\.]+) seconds'
         }
+        # All patterns fused into one named alternation so each line is scanned once;
+        # _pattern_groups maps each name to the slice of match.groups() holding its own groups
+        self._fused_re = re.compile('|'.join(f'(?P<{name}>{pattern})'
+                                             for name, pattern in self.cowrie_patterns.items()))
+        self._pattern_groups = {}
+        for name, pattern in self.cowrie_patterns.items():
+            start = self._fused_re.groupindex[name]
+            self._pattern_groups[name] = slice(start, start + re.compile(pattern).groups)
+        
+        # Parsed Cowrie attacks accumulated across fetches. Each fetch asks docker only for
+        # lines after the last docker timestamp seen (fixed-width, so strings compare in order)
+        self._cowrie_attacks = deque(maxlen=1000)
+        self._cowrie_since = None
+        self._cowrie_fetched_at = None
         
         # Training metrics
         self.training_results = []
         
     def get_real_cowrie_attacks(self) -> List[Dict]:
         """Extract real attacks from Cowrie honeypot logs"""
+        now = time.monotonic()
+        if self._cowrie_fetched_at is not None and now - self._cowrie_fetched_at < COWRIE_CACHE_TTL:
+            return list(self._cowrie_attacks)[-10:]
         try:
-            stdout, _ = self.env._execute_command("docker logs cowrie_honeypot --tail 100 2>/dev/null")
+            window = f"--since {self._cowrie_since}" if self._cowrie_since else "--tail 100"
+            stdout, _ = self.env._execute_command(f"docker logs -t {window} cowrie_honeypot 2>/dev/null")
+            self._cowrie_fetched_at = now
             if not stdout:
-                return []
+                return list(self._cowrie_attacks)[-10:]
             
-            attacks = []
+            attacks = self._cowrie_attacks
             for line in stdout.split('\n'):
                 if not line.strip():
                     continue
                 
-                # Extract timestamp
-                timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', line)
-                timestamp = timestamp_match.group(1) if timestamp_match else datetime.now().isoformat()
+                # --since is inclusive, so skip lines already seen
+                docker_ts, _, line = line.partition(' ')
+                if self._cowrie_since and docker_ts <= self._cowrie_since:
+                    continue
+                self._cowrie_since = docker_ts
                 
                 # Check for attack patterns
-                for pattern_name, pattern in self.cowrie_patterns.items():
-                    match = re.search(pattern, line)
-                    if match:
-                        attack = {
-                            'type': pattern_name,
-                            'timestamp': timestamp,
-                            'data': match.groups(),
-                            'mitre_technique': self.map_to_mitre(pattern_name),
-                            'raw_log': line
-                        }
-                        attacks.append(attack)
-                        break
+                match = self._fused_re.search(line)
+                if match:
+                    pattern_name = match.lastgroup
+                    # Extract timestamp
+                    timestamp_match = _TIMESTAMP_RE.search(line)
+                    timestamp = timestamp_match.group(1) if timestamp_match else datetime.now().isoformat()
+                    attack = {
+                        'type': pattern_name,
+                        'timestamp': timestamp,
+                        'data': match.groups()[self._pattern_groups[pattern_name]],
+                        'mitre_technique': self.map_to_mitre(pattern_name),
+                        'raw_log': line
+                    }
+                    attacks.append(attack)
             
-            return attacks[-10:]  # Return last 10 attacks
+            return list(attacks)[-10:]  # Return last 10 attacks
         except Exception as e:
             print(f"Error parsing Cowrie logs: {e}")
             return []
@@ -91,19 +132,13 @@ class RealDeceptiCloudFramework:
     
     def evaluate_honeypot_effectiveness(self, technique: str, honeypot_action: int) -> bool:
         """Evaluate honeypot effectiveness against MITRE technique"""
-        if technique not in self.mitre_techniques:
+        idx = self._tech_index.get(technique)
+        if idx is None:
             return False
         
-        tech_data = self.mitre_techniques[technique]
-        
-        if honeypot_action == 1:  # SSH honeypot
-            detection_prob = tech_data['ssh_effectiveness']
-        elif honeypot_action == 2:  # Web honeypot
-            detection_prob = tech_data['web_effectiveness']
-        else:  # No honeypot
-            detection_prob = 0.05
-        
-        return np.random.random() < detection_prob
+        # SSH and web honeypots use the technique's effectiveness; no honeypot detects 5%
+        action = honeypot_action if honeypot_action in (1, 2) else 0
+        return np.random.random() < self._detect_prob[idx, action]
     
     def train_with_real_data(self, episodes: int = 100):
         """Train agent using real Cowrie attack data and MITRE techniques"""
@@ -111,8 +146,8 @@ class RealDeceptiCloudFramework:
         print(f"Episodes: {episodes}")
         print(f"MITRE Techniques: {list(self.mitre_techniques.keys())}")
         
-        episode_rewards = []
-        detection_rates = []
+        episode_rewards = np.empty(episodes)
+        detection_rates = np.empty(episodes)
         real_attacks_used = 0
         
         for episode in range(episodes):
@@ -121,24 +156,31 @@ class RealDeceptiCloudFramework:
             attacks_detected = 0
             attacks_total = 0
             
-            print(f"\nEpisode {episode + 1}:")
-            
             # Get real attacks from Cowrie
             real_attacks = self.get_real_cowrie_attacks()
             if real_attacks:
-                print(f"  Found {len(real_attacks)} real attacks in Cowrie logs")
+                logger.debug("Episode %d: found %d real attacks in Cowrie logs", episode + 1, len(real_attacks))
                 real_attacks_used += len(real_attacks)
             
-            for step in range(10):  # 10 steps per episode
+            # Draw this episode's MITRE attack rolls, techniques and detection rolls up front,
+            # only for the steps real attacks don't cover
+            steps = 10  # 10 steps per episode
+            n_real = len(real_attacks)
+            if n_real < steps:
+                mitre_rolls = np.random.random(steps)
+                mitre_techs = np.random.choice(len(self._tech_ids), size=steps, p=self._tech_freq)
+                detect_rolls = np.random.random(steps)
+            
+            for step in range(steps):
                 # Agent decision
                 action = self.agent.act(state)
-                action_names = ['None', 'SSH', 'Web']
+                action_names = self.ACTION_NAMES
                 
                 # Execute action
                 next_state, reward, done = self.env.step(action)
                 
                 # Process attacks (real or MITRE-based)
-                if real_attacks and step < len(real_attacks):
+                if step < n_real:
                     # Use real attack
                     attack = real_attacks[step]
                     technique = attack['mitre_technique']
@@ -147,28 +189,27 @@ class RealDeceptiCloudFramework:
                     if detected:
                         attacks_detected += 1
                         reward += 15  # High reward for detecting real attacks
-                        print(f"    Real attack {technique} detected by {action_names[action]} honeypot")
+                        logger.debug("Real attack %s detected by %s honeypot", technique, action_names[action])
                     else:
                         reward -= 8  # High penalty for missing real attacks
-                        print(f"    Real attack {technique} missed")
+                        logger.debug("Real attack %s missed", technique)
                     
                     attacks_total += 1
                     
-                elif np.random.random() < 0.3:  # 30% chance of MITRE technique
+                elif mitre_rolls[step] < 0.3:  # 30% chance of MITRE technique
                     # Use MITRE technique
-                    techniques = list(self.mitre_techniques.keys())
-                    frequencies = [self.mitre_techniques[t]['frequency'] for t in techniques]
-                    technique = np.random.choice(techniques, p=frequencies)
+                    tech_idx = mitre_techs[step]
+                    technique = self._tech_ids[tech_idx]
                     
-                    detected = self.evaluate_honeypot_effectiveness(technique, action)
+                    detected = detect_rolls[step] < self._detect_prob[tech_idx, action]
                     
                     if detected:
                         attacks_detected += 1
                         reward += 10
-                        print(f"    MITRE {technique} detected by {action_names[action]} honeypot")
+                        logger.debug("MITRE %s detected by %s honeypot", technique, action_names[action])
                     else:
                         reward -= 5
-                        print(f"    MITRE {technique} missed")
+                        logger.debug("MITRE %s missed", technique)
                     
                     attacks_total += 1
                 
@@ -186,19 +227,21 @@ class RealDeceptiCloudFramework:
                 self.agent.learn(32, episode)
             
             # Record metrics
-            episode_rewards.append(total_reward)
+            episode_rewards[episode] = total_reward
             detection_rate = attacks_detected / max(1, attacks_total)
-            detection_rates.append(detection_rate)
+            detection_rates[episode] = detection_rate
             
-            print(f"  Reward: {total_reward:.1f}, Detection: {detection_rate:.2f}, Epsilon: {self.agent.epsilon:.3f}")
+            # One summary line per episode; per-attack detail is at debug level
+            print(f"Episode {episode + 1}: Reward: {total_reward:.1f}, Detection: {detection_rate:.2f}, "
+                  f"Epsilon: {self.agent.epsilon:.3f}, Real attacks: {len(real_attacks)}")
         
         results = {
-            'episode_rewards': episode_rewards,
-            'detection_rates': detection_rates,
+            'episode_rewards': episode_rewards.tolist(),
+            'detection_rates': detection_rates.tolist(),
             'real_attacks_used': real_attacks_used,
             'final_epsilon': self.agent.epsilon,
-            'avg_final_reward': np.mean(episode_rewards[-10:]),
-            'avg_final_detection': np.mean(detection_rates[-10:])
+            'avg_final_reward': episode_rewards[-10:].mean(),
+            'avg_final_detection': detection_rates[-10:].mean()
         }
         
         print(f"\nTraining Complete:")
@@ -214,18 +257,24 @@ class RealDeceptiCloudFramework:
         print(f"\nComparing Autonomous vs Static Systems")
         print(f"Test episodes: {test_episodes}")
         
+        # One sample of real attacks is shared by every episode of all three systems
+        real_attacks = self.get_real_cowrie_attacks()
+        
         # Test autonomous (trained agent)
         print("Testing Autonomous System...")
         self.agent.epsilon = 0.01  # Minimal exploration
-        autonomous_results = self._test_system_performance(test_episodes, use_agent=True)
+        autonomous_results = self._test_system_performance(test_episodes, use_agent=True,
+                                                           real_attacks=real_attacks)
         
         # Test static SSH
         print("Testing Static SSH Honeypot...")
-        static_ssh_results = self._test_system_performance(test_episodes, use_agent=False, static_action=1)
+        static_ssh_results = self._test_system_performance(test_episodes, use_agent=False, static_action=1,
+                                                           real_attacks=real_attacks)
         
         # Test static Web
         print("Testing Static Web Honeypot...")
-        static_web_results = self._test_system_performance(test_episodes, use_agent=False, static_action=2)
+        static_web_results = self._test_system_performance(test_episodes, use_agent=False, static_action=2,
+                                                           real_attacks=real_attacks)
         
         # Calculate improvements
         ssh_improvement = (autonomous_results['avg_reward'] - static_ssh_results['avg_reward']) / abs(static_ssh_results['avg_reward']) * 100
@@ -250,10 +299,17 @@ class RealDeceptiCloudFramework:
         
         return comparison
     
-    def _test_system_performance(self, episodes: int, use_agent: bool, static_action: int = None):
-        """Test system performance with real attack data"""
-        total_rewards = []
-        detection_rates = []
+    def _test_system_performance(self, episodes: int, use_agent: bool, static_action: int = None,
+                                 real_attacks: List[Dict] = None):
+        """Test system performance with real attack data
+
+        real_attacks is reused for every episode; it is fetched once here if not given.
+        """
+        if real_attacks is None:
+            real_attacks = self.get_real_cowrie_attacks()
+
+        total_rewards = np.empty(episodes)
+        detection_rates = np.empty(episodes)
         
         for episode in range(episodes):
             state = self.env.reset()
@@ -261,9 +317,6 @@ class RealDeceptiCloudFramework:
             attacks_detected = 0
             attacks_total = 0
             
-            # Get real attacks
-            real_attacks = self.get_real_cowrie_attacks()
-            
             for step in range(5):  # Shorter test episodes
                 # Select action
                 if use_agent:
@@ -290,14 +343,14 @@ class RealDeceptiCloudFramework:
                 if done:
                     break
             
-            total_rewards.append(episode_reward)
+            total_rewards[episode] = episode_reward
             detection_rate = attacks_detected / max(1, attacks_total)
-            detection_rates.append(detection_rate)
+            detection_rates[episode] = detection_rate
         
         return {
-            'avg_reward': np.mean(total_rewards),
-            'avg_detection': np.mean(detection_rates),
-            'reward_std': np.std(total_rewards)
+            'avg_reward': total_rewards.mean(),
+            'avg_detection': detection_rates.mean(),
+            'reward_std': total_rewards.std()
         }
     
     def generate_research_report(self, training_results: Dict, comparison_results: Dict):
@@ -4,19 +4,23 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
 import json
+import os
 import time
 from typing import Dict, List, Tuple
-from .monitoring import monitor
 from .environment import CloudHoneynetEnv
 from .agent import DQNAgent
 from .adversarial_attacker import AdversarialAttacker
 
 class DeceptiCloudResearchFramework:
-    def __init__(self, ec2_host: str, ec2_user: str, ec2_key: str):
+    def __init__(self, ec2_host: str, ec2_user: str, ec2_key: str, seed: int = None):
         self.ec2_host = ec2_host
         self.ec2_user = ec2_user
         self.ec2_key = ec2_key
         
+        # Random generator for the attack simulation; a seed makes the simulated attacks
+        # reproducible (the agent's exploration, replay sampling and torch init are not seeded)
+        self.rng = np.random.default_rng(seed)
+        
         # Initialize components
         self.env = CloudHoneynetEnv(ec2_host, ec2_user, ec2_key)
         self.agent = DQNAgent(state_size=2, action_size=3)
@@ -36,14 +40,27 @@ class DeceptiCloudResearchFramework:
             'container_escape': {'frequency': 0.05, 'success_rate': 0.35, 'detection_difficulty': 0.8}
         }
         
-    def train_autonomous_system(self, episodes: int = 500, save_interval: int = 50):
+        # Detection probability lookup table [action, attack id], difficulty already applied,
+        # so simulating an attack is a single comparison against a uniform draw
+        self._attack_ids = tuple(self.cloud_attack_patterns)
+        self._attack_index = {name: i for i, name in enumerate(self._attack_ids)}
+        self._detect_prob = np.array([
+            [self._base_detection_prob(attack_type, action) *
+             (1 - self.cloud_attack_patterns[attack_type]['detection_difficulty'] * 0.3)
+             for attack_type in self._attack_ids]
+            for action in range(3)
+        ])
+        
+    def train_autonomous_system(self, episodes: int = 500, save_interval: int = 50,
+                                train_freq: int = 1, batch_size: int = 32, min_new_transitions: int = 16):
         """Train the autonomous honeynet system with comprehensive metrics"""
         print(f"🧠 Training Autonomous DeceptiCloud System")
         print(f"Episodes: {episodes}, Save interval: {save_interval}")
         
-        episode_rewards = []
-        attack_detection_rates = []
-        honeypot_effectiveness = []
+        episode_rewards = np.empty(episodes)
+        attack_detection_rates = np.empty(episodes)
+        honeypot_effectiveness = np.empty(episodes)
+        new_transitions = 0  # remembered since the last learn() call
         
         for episode in range(episodes):
             state = self.env.reset()
@@ -51,8 +68,14 @@ class DeceptiCloudResearchFramework:
             attacks_detected = 0
             attacks_missed = 0
             
+            # Draw this episode's attack occurrences, attack types and detection rolls up front
+            steps = 20  # 20 steps per episode
+            attack_rolls = self.rng.random(steps)
+            attack_ids = self.rng.integers(0, len(self._attack_ids), steps)
+            detect_rolls = self.rng.random(steps)
+            
             # Simulate realistic attack scenarios
-            for step in range(20):  # 20 steps per episode
+            for step in range(steps):
                 # Agent selects action
                 action = self.agent.act(state)
                 
@@ -60,9 +83,8 @@ class DeceptiCloudResearchFramework:
                 next_state, reward, done = self.env.step(action)
                 
                 # Simulate adversarial attacks
-                if np.random.random() < 0.3:  # 30% chance of attack per step
-                    attack_type = np.random.choice(list(self.cloud_attack_patterns.keys()))
-                    attack_detected = self._simulate_attack(attack_type, action)
+                if attack_rolls[step] < 0.3:  # 30% chance of attack per step
+                    attack_detected = detect_rolls[step] < self._detect_prob[action, attack_ids[step]]
                     
                     if attack_detected:
                         attacks_detected += 1
@@ -73,6 +95,7 @@ class DeceptiCloudResearchFramework:
                 
                 # Store experience
                 self.agent.remember(state, action, reward, next_state, done)
+                new_transitions += 1
                 
                 state = next_state
                 total_reward += reward
@@ -80,34 +103,44 @@ class DeceptiCloudResearchFramework:
                 if done:
                     break
             
-            # Train agent
-            if len(self.agent.memory) > 32:
-                self.agent.learn(32, episode)
+            # Train agent (every train_freq episodes, from a minibatch of batch_size), skipping
+            # updates until enough new transitions have arrived to change the minibatch
+            if (episode % train_freq == 0 and len(self.agent.memory) > batch_size
+                    and new_transitions >= min_new_transitions):
+                self.agent.learn(batch_size, episode)
+                new_transitions = 0
             
             # Record metrics
-            episode_rewards.append(total_reward)
+            episode_rewards[episode] = total_reward
             detection_rate = attacks_detected / max(1, attacks_detected + attacks_missed)
-            attack_detection_rates.append(detection_rate)
+            attack_detection_rates[episode] = detection_rate
             
             # Calculate honeypot effectiveness
             effectiveness = self._calculate_effectiveness(attacks_detected, attacks_missed, action)
-            honeypot_effectiveness.append(effectiveness)
+            honeypot_effectiveness[episode] = effectiveness
             
-            # Log progress
+            # Log progress (only the first episode + 1 entries are filled in)
             if episode % 10 == 0:
-                avg_reward = np.mean(episode_rewards[-10:])
-                avg_detection = np.mean(attack_detection_rates[-10:])
+                recent = slice(max(0, episode - 9), episode + 1)
+                avg_reward = episode_rewards[recent].mean()
+                avg_detection = attack_detection_rates[recent].mean()
                 print(f"Episode {episode}: Avg Reward={avg_reward:.2f}, Detection Rate={avg_detection:.2f}, Epsilon={self.agent.epsilon:.3f}")
             
             # Save checkpoint
             if episode % save_interval == 0 and episode > 0:
-                self._save_training_checkpoint(episode, episode_rewards, attack_detection_rates, honeypot_effectiveness)
+                done_so_far = slice(0, episode + 1)
+                self._save_training_checkpoint(episode, episode_rewards[done_so_far],
+                                               attack_detection_rates[done_so_far],
+                                               honeypot_effectiveness[done_so_far])
         
         # Final training metrics
         self.training_metrics = {
-            'episode_rewards': episode_rewards,
-            'attack_detection_rates': attack_detection_rates,
-            'honeypot_effectiveness': honeypot_effectiveness,
+            'episode_rewards': episode_rewards.tolist(),
+            'attack_detection_rates': attack_detection_rates.tolist(),
+            'honeypot_effectiveness': honeypot_effectiveness.tolist(),
+            'avg_final_reward': float(episode_rewards[-50:].mean()) if episodes else 0.0,
+            'avg_final_detection': float(attack_detection_rates[-50:].mean()) if episodes else 0.0,
+            'avg_final_effectiveness': float(honeypot_effectiveness[-50:].mean()) if episodes else 0.0,
             'final_epsilon': self.agent.epsilon,
             'training_episodes': episodes
         }
@@ -143,58 +176,58 @@ class DeceptiCloudResearchFramework:
     
     def _test_system(self, episodes: int, use_agent: bool, static_action: int = None) -> Dict:
         """Test system performance"""
-        total_rewards = []
-        detection_rates = []
-        cost_efficiency = []
-        response_times = []
+        total_rewards = np.empty(episodes)
         
-        for episode in range(episodes):
-            state = self.env.reset()
-            episode_reward = 0
-            attacks_detected = 0
-            attacks_total = 0
-            deployment_costs = 0
-            
-            for step in range(15):  # Shorter test episodes
-                # Select action
-                if use_agent:
-                    action = self.agent.act(state)
-                    self.agent.epsilon = 0.01  # Minimal exploration during testing
-                else:
-                    action = static_action
-                
-                # Execute action
-                next_state, reward, done = self.env.step(action)
-                
-                # Track costs
-                if action != 0:  # Honeypot deployed
-                    deployment_costs += 1
+        # Attack occurrences, types and detection rolls for the whole test, drawn up front.
+        # The steps' actions are recorded so detection is scored for all episodes at once.
+        steps = 15  # Shorter test episodes
+        attack_mask = self.rng.random((episodes, steps)) < 0.4  # Higher attack rate for testing
+        attack_ids = self.rng.integers(0, len(self._attack_ids), (episodes, steps))
+        detect_rolls = self.rng.random((episodes, steps))
+        actions = np.zeros((episodes, steps), dtype=np.int64)
+        ran = np.zeros((episodes, steps), dtype=bool)
+        
+        # Minimal exploration during testing; restore the training epsilon afterwards
+        original_epsilon = self.agent.epsilon
+        if use_agent:
+            self.agent.epsilon = 0.01
+        try:
+            for episode in range(episodes):
+                state = self.env.reset()
+                episode_reward = 0
                 
-                # Simulate attacks
-                if np.random.random() < 0.4:  # Higher attack rate for testing
-                    attacks_total += 1
-                    attack_type = np.random.choice(list(self.cloud_attack_patterns.keys()))
+                for step in range(steps):
+                    # Select action
+                    if use_agent:
+                        action = self.agent.act(state)
+                    else:
+                        action = static_action
                     
-                    if self._simulate_attack(attack_type, action):
-                        attacks_detected += 1
-                
-                episode_reward += reward
-                state = next_state
+                    # Execute action
+                    next_state, reward, done = self.env.step(action)
+                    actions[episode, step] = action
+                    ran[episode, step] = True
+                    
+                    episode_reward += reward
+                    state = next_state
+                    
+                    if done:
+                        break
                 
-                if done:
-                    break
-            
-            # Calculate metrics
-            total_rewards.append(episode_reward)
-            detection_rate = attacks_detected / max(1, attacks_total)
-            detection_rates.append(detection_rate)
-            
-            efficiency = attacks_detected / max(1, deployment_costs)
-            cost_efficiency.append(efficiency)
-            
-            # Simulate response time (autonomous should be faster)
-            response_time = np.random.normal(2.5 if use_agent else 8.0, 1.0)
-            response_times.append(max(0.5, response_time))
+                total_rewards[episode] = episode_reward
+        finally:
+            self.agent.epsilon = original_epsilon
+        
+        # Simulate response times (autonomous should be faster)
+        response_times = self.rng.normal(2.5 if use_agent else 8.0, 1.0, episodes).clip(0.5, None)
+        
+        # Simulate attacks over the steps that ran and track costs (steps with a honeypot deployed)
+        attacked = attack_mask & ran
+        detected = attacked & (detect_rolls < self._detect_prob[actions, attack_ids])
+        attacks_detected = detected.sum(axis=1)
+        detection_rates = attacks_detected / np.maximum(1, attacked.sum(axis=1))
+        deployment_costs = ((actions != 0) & ran).sum(axis=1)
+        cost_efficiency = attacks_detected / np.maximum(1, deployment_costs)
         
         return {
             'avg_reward': np.mean(total_rewards),
@@ -208,8 +241,12 @@ class DeceptiCloudResearchFramework:
     
     def _simulate_attack(self, attack_type: str, honeypot_action: int) -> bool:
         """Simulate attack and determine if detected"""
-        pattern = self.cloud_attack_patterns[attack_type]
-        
+        action = honeypot_action if honeypot_action in (1, 2) else 0
+        return self.rng.random() < self._detect_prob[action, self._attack_index[attack_type]]
+    
+    @staticmethod
+    def _base_detection_prob(attack_type: str, honeypot_action: int) -> float:
+        """Detection probability of a honeypot against an attack type, before attack difficulty"""
         # Base detection probability
         base_detection = 0.1  # 10% chance with no honeypot
         
@@ -231,10 +268,7 @@ class DeceptiCloudResearchFramework:
         else:  # No honeypot
             detection_prob = base_detection
         
-        # Account for attack difficulty
-        detection_prob *= (1 - pattern['detection_difficulty'] * 0.3)
-        
-        return np.random.random() < detection_prob
+        return detection_prob
     
     def _calculate_effectiveness(self, detected: int, missed: int, action: int) -> float:
         """Calculate honeypot effectiveness score"""
@@ -281,8 +315,12 @@ class DeceptiCloudResearchFramework:
             'memory_size': len(self.agent.memory)
         }
         
-        with open(f'training_checkpoint_{episode}.json', 'w') as f:
+        # Write to a temporary file and rename it over the checkpoint, so an interrupted
+        # run never leaves a truncated checkpoint behind
+        path = f'training_checkpoint_{episode}.json'
+        with open(path + '.tmp', 'w') as f:
             json.dump(checkpoint, f, indent=2)
+        os.replace(path + '.tmp', path)
     
     def generate_research_report(self, results: Dict) -> str:
         """Generate comprehensive research report"""
@@ -296,8 +334,8 @@ This report demonstrates the superiority of autonomous adaptive honeynets over t
 ## Training Results
 - **Episodes Trained:** {self.training_metrics.get('training_episodes', 'N/A')}
 - **Final Exploration Rate:** {self.training_metrics.get('final_epsilon', 'N/A'):.3f}
-- **Average Final Reward:** {np.mean(self.training_metrics.get('episode_rewards', [0])[-50:]):.2f}
-- **Average Detection Rate:** {np.mean(self.training_metrics.get('attack_detection_rates', [0])[-50:]):.2f}
+- **Average Final Reward:** {self.training_metrics.get('avg_final_reward', 0):.2f}
+- **Average Detection Rate:** {self.training_metrics.get('avg_final_detection', 0):.2f}
 
 ## Performance Comparison
 
@@ -1,13 +1,28 @@
 import json
 
-def parse_cowrie_logs(log_lines):
+try:
+    import orjson  # optional, faster parser for large cowrie logs
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+def parse_cowrie_logs(log_lines, as_frame=False):
     # Placeholder: parse lines of cowrie JSON logs
+    # Accepts an iterable of lines (e.g. an open file) or a whole log as str/bytes.
+    # With as_frame=True the events come back as a pandas DataFrame, one column per field.
+    if isinstance(log_lines, (str, bytes, bytearray)):
+        log_lines = log_lines.splitlines()
     events = []
     for line in log_lines:
+        if not line.strip():
+            continue  # skip blank lines without going through the exception path
         try:
-            events.append(json.loads(line))
+            events.append(_json_loads(line))
         except Exception:
             continue
+    if as_frame:
+        import pandas as pd  # only needed for columnar analysis
+        return pd.DataFrame.from_records(events)
     return events
 
 
@@ -3,26 +3,31 @@
 System verification test for DeceptiCloud
 Tests all components before running full experiment
 """
+import argparse
+import importlib
+import io
 import os
 import sys
 import time
 import requests
 import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-def test_docker_honeypots():
+def test_docker_honeypots(log=print):
     """Test that Docker honeypots are running and accessible"""
-    print("=== Testing Docker Honeypots ===")
+    log("=== Testing Docker Honeypots ===")
     
     # Test web honeypot
     try:
         response = requests.get('http://localhost', timeout=5)
         if response.status_code == 200 and 'Admin Login' in response.text:
-            print("✅ Web honeypot: WORKING")
+            log("✅ Web honeypot: WORKING")
         else:
-            print("❌ Web honeypot: Response invalid")
+            log("❌ Web honeypot: Response invalid")
             return False
     except Exception as e:
-        print(f"❌ Web honeypot: {e}")
+        log(f"❌ Web honeypot: {e}")
         return False
     
     # Test SSH honeypot port
@@ -32,19 +37,19 @@ def test_docker_honeypots():
         result = sock.connect_ex(('localhost', 2222))
         sock.close()
         if result == 0:
-            print("✅ SSH honeypot: LISTENING on port 2222")
+            log("✅ SSH honeypot: LISTENING on port 2222")
         else:
-            print("❌ SSH honeypot: Port 2222 not accessible")
+            log("❌ SSH honeypot: Port 2222 not accessible")
             return False
     except Exception as e:
-        print(f"❌ SSH honeypot: {e}")
+        log(f"❌ SSH honeypot: {e}")
         return False
     
     return True
 
-def test_python_imports():
+def test_python_imports(log=print):
     """Test that all required Python modules can be imported"""
-    print("\n=== Testing Python Imports ===")
+    log("\n=== Testing Python Imports ===")
     
     modules = [
         ('torch', 'PyTorch for RL agent'),
@@ -56,19 +61,32 @@ def test_python_imports():
         ('src.attacker', 'Attacker module')
     ]
     
-    for module, description in modules:
+    def try_import(module):
         try:
-            __import__(module)
-            print(f"✅ {module}: OK ({description})")
-        except ImportError as e:
-            print(f"❌ {module}: FAILED - {e}")
+            importlib.import_module(module)
+        except Exception as e:  # broken installs can raise OSError etc., not just ImportError
+            return e
+        return None
+    
+    # Third-party imports are independent and mostly wait on disk, so load them in parallel;
+    # the src.* modules build on them and are imported afterwards on this thread
+    third_party = [module for module, _ in modules if not module.startswith('src.')]
+    with ThreadPoolExecutor(max_workers=len(third_party)) as pool:
+        errors = dict(zip(third_party, pool.map(try_import, third_party)))
+    
+    for module, description in modules:
+        e = errors[module] if module in errors else try_import(module)
+        if e is None:
+            log(f"✅ {module}: OK ({description})")
+        else:
+            log(f"❌ {module}: FAILED - {e}")
             return False
     
     return True
 
-def test_environment_creation():
+def test_environment_creation(log=print):
     """Test creating the CloudHoneynetEnv in dry-run mode"""
-    print("\n=== Testing Environment Creation ===")
+    log("\n=== Testing Environment Creation ===")
     
     try:
         from src.environment import CloudHoneynetEnv
@@ -81,61 +99,78 @@ def test_environment_creation():
             key_file="test.pem", 
             dry_run=True
         )
-        print("✅ Environment creation: OK")
+        log("✅ Environment creation: OK")
         
         # Test agent creation
         agent = DQNAgent(state_size=2, action_size=3)
-        print("✅ Agent creation: OK")
+        log("✅ Agent creation: OK")
         
         # Test basic interaction
         state = env.reset()
         action = agent.act(state)
         next_state, reward, done = env.step(action)
-        print(f"✅ Basic interaction: OK (action={action}, reward={reward})")
+        log(f"✅ Basic interaction: OK (action={action}, reward={reward})")
         
         return True
         
     except Exception as e:
-        print(f"❌ Environment test: {e}")
+        log(f"❌ Environment test: {e}")
         return False
 
-def test_attack_simulation():
-    """Test attack simulation against honeypots"""
-    print("\n=== Testing Attack Simulation ===")
+def test_attack_simulation(log=print, ssh_login=False):
+    """Test attack simulation against honeypots (ssh_login adds a full SSH login attempt)"""
+    log("\n=== Testing Attack Simulation ===")
     
     try:
         # Test web attack
         login_data = {'username': 'admin', 'password': 'test123'}
         response = requests.post('http://localhost/login', data=login_data, timeout=5)
         if response.status_code == 401:
-            print("✅ Web attack simulation: OK (login rejected as expected)")
+            log("✅ Web attack simulation: OK (login rejected as expected)")
         else:
-            print(f"❌ Web attack simulation: Unexpected response {response.status_code}")
+            log(f"❌ Web attack simulation: Unexpected response {response.status_code}")
             return False
             
-        # Test SSH attack (just connection test)
-        import paramiko
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        try:
-            ssh.connect('localhost', port=2222, username='test', password='test', timeout=5)
-            print("❌ SSH attack simulation: Login succeeded (should fail)")
+        # Test SSH attack: reading the server banner shows the honeypot speaks SSH,
+        # without paying for a key exchange
+        with socket.create_connection(('localhost', 2222), timeout=5) as sock:
+            banner = sock.recv(64)
+        if banner.startswith(b'SSH-'):
+            version = banner.splitlines()[0].decode(errors='replace')
+            log(f"✅ SSH attack simulation: OK (banner {version})")
+        else:
+            log(f"❌ SSH attack simulation: Unexpected banner {banner!r}")
             return False
-        except paramiko.AuthenticationException:
-            print("✅ SSH attack simulation: OK (login rejected as expected)")
-        except Exception as e:
-            print(f"✅ SSH attack simulation: OK (connection handled: {e})")
-        finally:
-            ssh.close()
+        
+        if ssh_login:
+            # Full login attempt (key exchange + auth), only when asked for
+            import paramiko
+            ssh = paramiko.SSHClient()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            try:
+                ssh.connect('localhost', port=2222, username='test', password='test', timeout=5)
+                log("❌ SSH attack simulation: Login succeeded (should fail)")
+                return False
+            except paramiko.AuthenticationException:
+                log("✅ SSH attack simulation: OK (login rejected as expected)")
+            except Exception as e:
+                log(f"✅ SSH attack simulation: OK (connection handled: {e})")
+            finally:
+                ssh.close()
             
         return True
         
     except Exception as e:
-        print(f"❌ Attack simulation: {e}")
+        log(f"❌ Attack simulation: {e}")
         return False
 
 def main():
     """Run all system tests"""
+    parser = argparse.ArgumentParser(description='DeceptiCloud System Verification')
+    parser.add_argument('--ssh-login', action='store_true',
+                        help='Also attempt a full SSH login against the honeypot (slower)')
+    args = parser.parse_args()
+    
     print("=== DeceptiCloud System Verification ===")
     print("=" * 50)
     
@@ -146,11 +181,28 @@ def main():
         test_attack_simulation
     ]
     
+    # The honeypot probes only wait on the network (up to 5s timeouts each), so they run in
+    # background threads while the import and environment tests run here. Each test logs
+    # into its own buffer, printed in the original order once everything has finished.
+    background = {test_docker_honeypots: {}, test_attack_simulation: {'ssh_login': args.ssh_login}}
+    outputs = {test: io.StringIO() for test in tests}
+    results = {}
+    
+    with ThreadPoolExecutor(max_workers=len(background)) as pool:
+        futures = {test: pool.submit(test, partial(print, file=outputs[test]), **kwargs)
+                   for test, kwargs in background.items()}
+        for test in tests:
+            if test not in futures:
+                results[test] = test(partial(print, file=outputs[test]))
+        for test, future in futures.items():
+            results[test] = future.result()
+    
     passed = 0
     total = len(tests)
     
     for test in tests:
-        if test():
+        sys.stdout.write(outputs[test].getvalue())
+        if results[test]:
             passed += 1
         print()
     